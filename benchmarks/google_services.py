@@ -0,0 +1,68 @@
+"""Per-call overhead of getting a Google discovery client.
+
+Compares building the Gmail service from scratch on every call, as the
+clients did before the shared registry, with ``google.get_service``. Uses a
+throwaway service account key and makes no network calls.
+
+    python -m benchmarks.google_services [calls]
+"""
+
+import json
+import os
+import sys
+import time
+from functools import partial
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from googleapiclient.discovery import build
+
+from comms.clients import google
+from comms.config import GMAIL_SCOPES, GoogleConfig
+
+
+def _use_test_key() -> None:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = json.dumps({
+        "type": "service_account",
+        "project_id": "benchmark",
+        "private_key_id": "benchmark",
+        "private_key": pem.decode(),
+        "client_email": "benchmark@benchmark.iam.gserviceaccount.com",
+        "client_id": "1",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    })
+
+
+def _per_call(get, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        get()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def _rebuild():
+    creds = GoogleConfig().get_credentials(GMAIL_SCOPES)
+    return build("gmail", "v1", credentials=creds)
+
+
+def main(calls: int = 50) -> None:
+    _use_test_key()
+    google.clear()
+    before = _per_call(_rebuild, calls)
+    shared = partial(google.get_service, "gmail", "v1", GMAIL_SCOPES)
+    first = _per_call(shared, 1)
+    after = _per_call(shared, calls)
+    print(f"{calls} calls of the Gmail service")
+    print(f"  rebuild per call:        {before:8.3f} ms/call")
+    print(f"  shared registry, first:  {first:8.3f} ms")
+    print(f"  shared registry, reuse:  {after:8.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,110 @@
+"""Per-call latency of a fresh connection versus the pooled upstream session.
+
+Starts a local keep-alive stub server and times sequential GETs made with
+module-level ``requests.get``, as the Ashby, Grain and Notion clients did
+before the shared transport, against ``http.request``. With ``--tls`` the
+stub serves HTTPS with a throwaway self-signed certificate, which is where
+reusing connections matters most.
+
+    python -m benchmarks.http_pool [calls] [--tls]
+"""
+
+import datetime
+import json
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from comms.clients import http
+
+_BODY = json.dumps({"ok": True, "transcript": "Alice: hello\n" * 50}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _self_signed(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    return cert_path, key_path
+
+
+def _per_call(get, calls: int) -> float:
+    get()  # Warm up imports, DNS and (for the pool) the first connection.
+    start = time.perf_counter()
+    for _ in range(calls):
+        get().raise_for_status()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main(calls: int = 200, tls: bool = False) -> None:
+    server = ThreadingHTTPServer(("localhost", 0), _Handler)
+    verify: bool | str = True
+    scheme = "http"
+    with tempfile.TemporaryDirectory() as tmp:
+        if tls:
+            cert_path, key_path = _self_signed(Path(tmp))
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert_path, key_path)
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+            verify, scheme = str(cert_path), "https"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"{scheme}://localhost:{server.server_address[1]}/transcript.txt"
+        try:
+            before = _per_call(lambda: requests.get(url, verify=verify), calls)
+            after = _per_call(
+                lambda: http.request("benchmark", "GET", url, verify=verify), calls
+            )
+        finally:
+            server.shutdown()
+    print(f"{calls} sequential GETs over {scheme}")
+    print(f"  fresh connection:  {before:7.2f} ms/call")
+    print(f"  pooled session:    {after:7.2f} ms/call")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--tls"]
+    main(*map(int, args[:1]), tls="--tls" in sys.argv[1:])
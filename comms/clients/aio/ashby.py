@@ -0,0 +1,134 @@
+"""Async Ashby ATS API client — same functions as comms.clients.ashby."""
+
+from .. import http
+from ..ashby import (
+    _feedback_payload,
+    _find_pending_event,
+    _form_definition_id,
+    _get_config,
+)
+
+
+async def _post(endpoint: str, payload: dict, idempotent: bool = False) -> dict:
+    config = _get_config()
+    resp = await http.arequest(
+        "ashby", "POST", f"{config.base_url}/{endpoint}",
+        idempotent=idempotent,
+        json=payload,
+        auth=(config.api_key, ""),
+        headers={"Content-Type": "application/json"},
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def search_candidates(name: str) -> list[dict]:
+    """Search candidates by name."""
+    data = await _post("candidate.search", {"name": name}, idempotent=True)
+    return data.get("results", [])
+
+
+async def get_application(application_id: str) -> dict:
+    """Get application details including current stage."""
+    data = await _post(
+        "application.info", {"applicationId": application_id}, idempotent=True
+    )
+    return data.get("results", data)
+
+
+async def list_interview_stages(interview_plan_id: str) -> list[dict]:
+    """List ordered stages for an interview plan."""
+    data = await _post(
+        "interviewStage.list", {"interviewPlanId": interview_plan_id},
+        idempotent=True,
+    )
+    return data.get("results", [])
+
+
+async def list_archive_reasons() -> list[dict]:
+    """List available archive/rejection reasons."""
+    data = await _post("archiveReason.list", {}, idempotent=True)
+    return data.get("results", [])
+
+
+async def list_interview_schedules(application_id: str) -> list[dict]:
+    """List interview schedules for an application."""
+    data = await _post(
+        "interviewSchedule.list", {"applicationId": application_id},
+        idempotent=True,
+    )
+    return data.get("results", [])
+
+
+async def get_interview(interview_id: str) -> dict:
+    """Get interview details including feedback form definition."""
+    data = await _post("interview.info", {"id": interview_id}, idempotent=True)
+    return data.get("results", data)
+
+
+async def get_feedback_form_definition(form_definition_id: str) -> dict:
+    """Get feedback form definition with field paths and types."""
+    data = await _post(
+        "feedbackFormDefinition.info",
+        {"feedbackFormDefinitionId": form_definition_id},
+        idempotent=True,
+    )
+    return data.get("results", data)
+
+
+async def submit_feedback(
+    application_id: str,
+    summary: str,
+    score: int,
+    recommendation: str,
+) -> dict:
+    """Submit interview scorecard feedback.
+
+    Discovers the pending interview event and feedback form automatically,
+    then submits the overall recommendation plus summary text.
+    """
+    schedules = await list_interview_schedules(application_id)
+    interview_event_id, interview_id, user_id = _find_pending_event(schedules)
+
+    form_def_id = _form_definition_id(await get_interview(interview_id), interview_id)
+
+    form_def = await get_feedback_form_definition(form_def_id)
+    payload = _feedback_payload(
+        application_id, summary, score, interview_event_id, user_id,
+        form_def_id, form_def,
+    )
+
+    data = await _post("applicationFeedback.submit", payload)
+    return data.get("results", data)
+
+
+async def progress_candidate(
+    application_id: str, interview_stage_id: str
+) -> dict:
+    """Move candidate to the next interview stage."""
+    data = await _post(
+        "application.changeStage",
+        {
+            "applicationId": application_id,
+            "interviewStageId": interview_stage_id,
+        },
+    )
+    return data.get("results", data)
+
+
+async def reject_candidate(
+    application_id: str,
+    archive_reason_id: str,
+    rejection_template_id: str = "07e79d76-8a03-44ac-9c2d-76ad5d4e3ab7",
+) -> dict:
+    """Archive/reject candidate with rejection email."""
+    data = await _post(
+        "application.changeStage",
+        {
+            "applicationId": application_id,
+            "archiveReasonId": archive_reason_id,
+            "sendRejectionEmail": True,
+            "rejectionEmailTemplateId": rejection_template_id,
+        },
+    )
+    return data.get("results", data)
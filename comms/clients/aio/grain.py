@@ -0,0 +1,110 @@
+"""Async Grain API client — same functions as comms.clients.grain."""
+
+import asyncio
+
+import httpx
+
+from ...config import GrainConfig
+from .. import http, transcript_cache, transcripts
+from ..grain import (
+    _day_window,
+    _get_config,
+    _headers,
+    _is_settled,
+    _page_in_window,
+    _recordings_payload,
+)
+
+
+async def list_grain_recordings(date: str = "") -> list[dict]:
+    """List recordings for a date (YYYY-MM-DD). Defaults to today."""
+    config = _get_config()
+    start, end = _day_window(date)
+
+    all_recordings: list[dict] = []
+    cursor = None
+
+    while True:
+        resp = await http.arequest(
+            "grain", "POST", f"{config.base_url}/recordings",
+            idempotent=True,
+            headers=_headers(config),
+            json=_recordings_payload(start, end, cursor),
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        recordings = data.get("recordings", [])
+        matches, done = _page_in_window(recordings, start, end)
+        all_recordings.extend(matches)
+
+        next_cursor = data.get("cursor")
+        if done or not next_cursor or not recordings:
+            break
+        cursor = next_cursor
+
+    return all_recordings
+
+
+async def _get_recording(config: GrainConfig, recording_id: str) -> dict:
+    """Recording metadata, or {} if it cannot be fetched."""
+    try:
+        resp = await http.arequest(
+            "grain", "GET", f"{config.base_url}/recordings/{recording_id}",
+            headers=_headers(config),
+        )
+        return resp.json() if resp.is_success else {}
+    except (httpx.HTTPError, ValueError):
+        return {}
+
+
+async def get_grain_transcript(recording_id: str) -> str:
+    """Full transcript (Speaker: line format).
+
+    Cached on disk once the recording has finished processing; its metadata
+    is fetched alongside the transcript to tell.
+    """
+    cached = transcript_cache.get(recording_id)
+    if cached is not None:
+        return cached
+    config = _get_config()
+    resp, recording = await asyncio.gather(
+        http.arequest(
+            "grain", "GET",
+            f"{config.base_url}/recordings/{recording_id}/transcript.txt",
+            headers=_headers(config),
+        ),
+        _get_recording(config, recording_id),
+    )
+    resp.raise_for_status()
+    if resp.text and _is_settled(recording):
+        transcript_cache.put(recording_id, resp.text)
+    return resp.text
+
+
+async def slice_grain_transcript(
+    recording_id: str,
+    speaker: str = "",
+    start: str = "",
+    end: str = "",
+    last_minutes: int = 0,
+    keyword: str = "",
+    context: int = 2,
+    page: int = 1,
+    page_size: int = 50,
+) -> dict:
+    """Part of a transcript as turns, selected by speaker, time, keyword or page."""
+    text = await get_grain_transcript(recording_id)
+    turns = transcripts.get_turns(recording_id, text)
+    result = transcripts.slice_turns(
+        turns,
+        speaker=speaker,
+        start=start,
+        end=end,
+        last_minutes=last_minutes,
+        keyword=keyword,
+        context=context,
+        page=page,
+        page_size=page_size,
+    )
+    return {"recording_id": recording_id, **result}
@@ -0,0 +1,59 @@
+"""Async Grain recordings index — same functions as comms.clients.grain_index."""
+
+from contextlib import closing
+
+from .. import http
+from ..grain import _get_config, _headers, _page_in_window, _recordings_payload
+from ..grain_index import (
+    _apply_refresh,
+    _connect,
+    _query,
+    _range_window,
+    _refresh_bound,
+)
+from .locks import LoopLock
+
+_refresh_lock = LoopLock()
+
+
+async def _fetch_since(bound: str) -> list[dict]:
+    config = _get_config()
+    fetched: list[dict] = []
+    cursor = None
+    while True:
+        resp = await http.arequest(
+            "grain", "POST", f"{config.base_url}/recordings",
+            idempotent=True,
+            headers=_headers(config),
+            json=_recordings_payload(bound, "", cursor),
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        recordings = data.get("recordings", [])
+        matches, done = _page_in_window(recordings, bound, "")
+        fetched.extend(matches)
+
+        cursor = data.get("cursor")
+        if done or not cursor or not recordings:
+            return fetched
+
+
+async def list_recordings(
+    start_date: str = "",
+    end_date: str = "",
+    participant: str = "",
+    title: str = "",
+) -> list[dict]:
+    """Recordings from start_date through end_date (YYYY-MM-DD), newest first.
+
+    Both dates default to today. ``participant`` and ``title`` are
+    case-insensitive substring filters.
+    """
+    start, end = _range_window(start_date, end_date)
+    async with _refresh_lock.get():
+        with closing(_connect()) as conn:
+            bound = _refresh_bound(conn, start)
+            if bound is not None:
+                _apply_refresh(conn, bound, await _fetch_since(bound))
+            return _query(conn, start, end, participant, title)
@@ -0,0 +1,25 @@
+"""Event-loop-safe locks for module-level async state."""
+
+import asyncio
+import threading
+import weakref
+
+
+class LoopLock:
+    """An asyncio.Lock per event loop, created on first use inside that loop.
+
+    A plain asyncio.Lock binds to the first loop that waits on it, so one
+    created at import time breaks once a second loop uses it.
+    """
+
+    def __init__(self):
+        self._locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._guard = threading.Lock()
+
+    def get(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._guard:
+            lock = self._locks.get(loop)
+            if lock is None:
+                lock = self._locks[loop] = asyncio.Lock()
+            return lock
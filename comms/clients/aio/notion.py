@@ -0,0 +1,112 @@
+"""Async Notion API client — same functions as comms.clients.notion."""
+
+import asyncio
+import time
+
+from .. import http, notion_cache
+from ..notion import (
+    _MAX_BLOCKS,
+    _MAX_DEPTH,
+    _UNREADABLE_STATUSES,
+    _TreeWalk,
+    _format_page,
+    _format_search_result,
+    _get_config,
+    _headers,
+    _search_payload,
+)
+
+# Block-children requests in flight at once while walking a page; the
+# notion rate limiter still paces them.
+_TREE_CONCURRENCY = 3
+
+
+async def search_pages(query: str, max_results: int = 20) -> list[dict]:
+    """Search Notion pages and databases by query text."""
+    config = _get_config()
+    resp = await http.arequest(
+        "notion", "POST", f"{config.base_url}/search",
+        idempotent=True,
+        headers=_headers(config),
+        json=_search_payload(query, max_results),
+    )
+    resp.raise_for_status()
+    results = resp.json().get("results", [])
+    return [_format_search_result(item) for item in results]
+
+
+async def _get_page(page_id: str) -> dict:
+    config = _get_config()
+    resp = await http.arequest(
+        "notion", "GET", f"{config.base_url}/pages/{page_id}",
+        headers=_headers(config),
+    )
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def _list_children(block_id: str) -> list[dict] | None:
+    """All children of a block, or None if the integration cannot read them."""
+    config = _get_config()
+    blocks: list[dict] = []
+    cursor = None
+    while True:
+        params = {"page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+        resp = await http.arequest(
+            "notion", "GET", f"{config.base_url}/blocks/{block_id}/children",
+            headers=_headers(config),
+            params=params,
+        )
+        if resp.status_code in _UNREADABLE_STATUSES:
+            return None
+        resp.raise_for_status()
+        data = resp.json()
+        blocks.extend(data.get("results", []))
+        if not data.get("has_more"):
+            return blocks
+        cursor = data.get("next_cursor")
+
+
+async def _walk_tree(page_id: str, max_depth: int, max_blocks: int) -> _TreeWalk:
+    """Fetch a page's block tree level by level, a few requests at a time."""
+    walk = _TreeWalk(page_id, max_depth, max_blocks)
+    semaphore = asyncio.Semaphore(_TREE_CONCURRENCY)
+
+    async def fetch(block_id: str) -> tuple[str, list[dict] | None]:
+        async with semaphore:
+            return block_id, await _list_children(block_id)
+
+    level = [page_id]
+    depth = 0
+    while level:
+        fetched = await asyncio.gather(*(fetch(block_id) for block_id in level))
+        level = walk.add_level(fetched, depth)
+        depth += 1
+    return walk
+
+
+async def read_page(
+    page_id: str, max_depth: int = _MAX_DEPTH, max_blocks: int = _MAX_BLOCKS
+) -> dict:
+    """Read full content of a Notion page. Returns blocks as plain text.
+
+    Walks nested blocks breadth-first down to ``max_depth`` levels and
+    ``max_blocks`` blocks, fetching each level's children concurrently.
+    Unchanged pages are served from the local cache after a single page
+    request.
+    """
+    started = time.time()
+    page = await _get_page(page_id)
+    cached = notion_cache.get(page, max_depth, max_blocks)
+    if cached is not None:
+        content, truncated = cached
+        return _format_page(page, [content], truncated)
+    walk = await _walk_tree(page_id, max_depth, max_blocks)
+    result = _format_page(page, walk.render(), walk.truncated)
+    if walk.self_contained:
+        notion_cache.put(
+            page, max_depth, max_blocks, result["content"], walk.truncated, started
+        )
+    return result
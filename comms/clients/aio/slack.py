@@ -0,0 +1,260 @@
+"""Async Slack Web API client — same functions as comms.clients.slack.
+
+slack_sdk's AsyncWebClient needs aiohttp, so Web API methods are called
+directly over the shared httpx transport instead.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import httpx
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.slack_response import SlackResponse
+
+from .. import http
+from ..slack import (
+    _CHANNEL_TYPES,
+    _LIST_PAGE_SIZE,
+    _SEARCH_PAGE_SIZE,
+    _THREAD_PAGE_SIZE,
+    _WRITE_METHODS,
+    _Directory,
+    _channel_entries,
+    _channels,
+    _display_name,
+    _expand_thread,
+    _format_post,
+    _format_reply,
+    _format_search,
+    _get_config,
+    _newer_than,
+    _replies_params,
+    _select_channels,
+    _thread_window,
+    _threads_to_expand,
+    _user_entries,
+    _users,
+)
+
+logger = logging.getLogger(__name__)
+
+_background: set[asyncio.Task] = set()
+
+
+def _form_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+async def _api_call(api_method: str, **params) -> dict:
+    """Call a Web API method with the user token; raise SlackApiError if not ok."""
+    config = _get_config()
+    if not config.user_token:
+        raise ValueError("Missing SLACK_USER_TOKEN environment variable")
+    url = f"{config.base_url}{api_method}"
+    resp = await http.arequest(
+        "slack", "POST", url,
+        idempotent=api_method not in _WRITE_METHODS,
+        limit_method=api_method,
+        data={k: _form_value(v) for k, v in params.items()},
+        headers={"Authorization": f"Bearer {config.user_token}"},
+    )
+    data = resp.json()
+    if not data.get("ok"):
+        response = SlackResponse(
+            client=None,
+            http_verb="POST",
+            api_url=url,
+            req_args={},
+            data=data,
+            headers=dict(resp.headers),
+            status_code=resp.status_code,
+        )
+        raise SlackApiError(
+            f"The request to the Slack API failed. (url: {url})", response
+        )
+    return data
+
+
+async def _resolve_user_name(user_id: str) -> str:
+    """Resolve a Slack user ID to a display name."""
+    try:
+        resp = await _api_call("users.info", user=user_id)
+        return _display_name(resp["user"], user_id)
+    except Exception:
+        return user_id
+
+
+async def _list_all(api_method: str, key: str, **params) -> list[dict]:
+    """Every item of a cursor-paginated listing."""
+    items: list[dict] = []
+    params["limit"] = _LIST_PAGE_SIZE
+    while True:
+        resp = await _api_call(api_method, **params)
+        items.extend(resp.get(key, []))
+        cursor = resp.get("response_metadata", {}).get("next_cursor", "")
+        if not cursor:
+            return items
+        params["cursor"] = cursor
+
+
+async def _load_users() -> dict[str, str]:
+    return _user_entries(await _list_all("users.list", "members"))
+
+
+async def _load_channels() -> dict[str, dict]:
+    return _channel_entries(await _list_all(
+        "conversations.list", "channels",
+        types=_CHANNEL_TYPES, exclude_archived=True,
+    ))
+
+
+async def _refresh(
+    directory: _Directory, load: Callable[[], Awaitable[dict]]
+) -> None:
+    try:
+        directory.replace(await load())
+    except Exception:
+        directory.refresh_failed()
+        logger.warning("Slack directory refresh failed", exc_info=True)
+
+
+async def _ensure_loaded(
+    directory: _Directory, load: Callable[[], Awaitable[dict]]
+) -> None:
+    """Load a directory on first use; refresh it in the background when stale."""
+    if not directory.loaded:
+        async with directory.async_load_lock.get():
+            if not directory.loaded:
+                directory.replace(await load())
+    elif directory.begin_refresh():
+        task = asyncio.create_task(_refresh(directory, load))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+
+async def _user_name(user_id: str) -> str:
+    """Display name from the directory; users.info only for users it lacks."""
+    name = _users.get(user_id)
+    if name is None:
+        name = await _resolve_user_name(user_id)
+        _users.add(user_id, name)
+    return name
+
+
+async def _channel_id(channel: str) -> str:
+    """Resolve "#name" through the channel index; other values pass through."""
+    if not channel.startswith("#"):
+        return channel
+    name = channel[1:]
+    await _ensure_loaded(_channels, _load_channels)
+    channel_id = _channels.id_for(name)
+    if channel_id is None:
+        # Possibly created since the index was loaded.
+        _channels.replace(await _load_channels())
+        channel_id = _channels.id_for(name)
+    # Unknown names go through as-is for Slack to resolve or reject.
+    return channel_id or channel
+
+
+async def _expand(channel_id: str, thread: dict) -> None:
+    try:
+        resp = await _api_call(
+            "conversations.replies",
+            channel=channel_id, ts=thread["thread_ts"], limit=_THREAD_PAGE_SIZE,
+        )
+    except (SlackApiError, httpx.HTTPError):
+        # Throttled or failed expansions leave the thread unexpanded.
+        return
+    replies = resp.get("messages", [])
+    user_ids = list({m["user"] for m in replies if m.get("user")})
+    names = await asyncio.gather(*(_user_name(u) for u in user_ids))
+    _expand_thread(thread, replies, dict(zip(user_ids, names)))
+
+
+async def search_messages(
+    query: str, max_results: int = 20, expand_threads: int = 5
+) -> dict:
+    """Search Slack messages across all public/joined channels.
+
+    Follows result pages up to ``max_results`` and groups matches by
+    channel and thread. The first ``expand_threads`` threads also get their
+    reply count and first page of replies, fetched concurrently.
+    """
+    await _ensure_loaded(_users, _load_users)
+    page_size = min(_SEARCH_PAGE_SIZE, max(1, max_results))
+    matches: list[dict] = []
+    total = 0
+    page = 1
+    while len(matches) < max_results:
+        resp = await _api_call(
+            "search.messages", query=query, count=page_size, page=page
+        )
+        messages = resp.get("messages", {})
+        matches.extend(messages.get("matches", []))
+        total = messages.get("total", len(matches))
+        pages = messages.get("paging", {}).get("pages", 1)
+        if not messages.get("matches") or page >= pages:
+            break
+        page += 1
+    result = _format_search(query, total, matches[:max_results])
+
+    await asyncio.gather(*(
+        _expand(channel_id, thread)
+        for channel_id, thread in _threads_to_expand(result["channels"], expand_threads)
+    ))
+    return result
+
+
+async def read_thread(
+    channel_id: str, thread_ts: str, since_ts: str = "", limit: int = 0
+) -> dict:
+    """Read a Slack thread by channel ID and thread timestamp.
+
+    Follows every page of replies. ``since_ts`` returns only messages newer
+    than that timestamp, so a caller can poll for new replies by passing
+    the ``latest_ts`` from its previous read. ``limit`` caps the messages
+    returned (0 for no cap).
+    """
+    await _ensure_loaded(_users, _load_users)
+    params = _replies_params(channel_id, thread_ts, since_ts, limit)
+    messages: list[dict] = []
+    while True:
+        resp = await _api_call("conversations.replies", **params)
+        messages.extend(_newer_than(resp.get("messages", []), since_ts))
+        cursor = resp.get("response_metadata", {}).get("next_cursor", "")
+        if not cursor or (limit > 0 and len(messages) >= limit):
+            break
+        params["cursor"] = cursor
+    messages, has_more, latest_ts = _thread_window(
+        messages, limit, bool(cursor), since_ts
+    )
+    user_ids = list(dict.fromkeys(m["user"] for m in messages if m.get("user")))
+    names = dict(zip(
+        user_ids, await asyncio.gather(*(_user_name(u) for u in user_ids))
+    ))
+    return {
+        "messages": [
+            _format_reply(msg, names.get(msg.get("user", ""), "")) for msg in messages
+        ],
+        "has_more": has_more,
+        "latest_ts": latest_ts,
+    }
+
+
+async def list_channels(limit: int = 100, prefix: str = "") -> list[dict]:
+    """List available Slack channels by name, from the cached channel index."""
+    await _ensure_loaded(_users, _load_users)
+    await _ensure_loaded(_channels, _load_channels)
+    return _select_channels(prefix, limit)
+
+
+async def send_message(channel: str, text: str, thread_ts: str = "") -> dict:
+    """Post a message to a Slack channel (ID or #name) as Mel (user token)."""
+    kwargs = {"channel": await _channel_id(channel), "text": text}
+    if thread_ts:
+        kwargs["thread_ts"] = thread_ts
+    resp = await _api_call("chat.postMessage", **kwargs)
+    return _format_post(resp)
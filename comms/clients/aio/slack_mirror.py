@@ -0,0 +1,97 @@
+"""Async Slack mirror — same functions as comms.clients.slack_mirror."""
+
+import asyncio
+import logging
+from contextlib import closing
+
+from .. import retry
+from ..slack_mirror import (
+    _begin_sync,
+    _channel_name,
+    _connect,
+    _end_sync,
+    _mark_synced,
+    _mirror_config,
+    _search,
+    _store,
+    _sync_window,
+    _thread_roots,
+)
+from .slack import (
+    _channel_id,
+    _ensure_loaded,
+    _list_all,
+    _load_users,
+    _users,
+)
+from .locks import LoopLock
+
+logger = logging.getLogger(__name__)
+
+_sync_lock = LoopLock()
+_background: set[asyncio.Task] = set()
+
+
+async def _thread_replies(channel_id: str, root_ts: str) -> list[dict]:
+    thread = await _list_all(
+        "conversations.replies", "messages", channel=channel_id, ts=root_ts
+    )
+    return [m for m in thread if m.get("ts") != root_ts]
+
+
+async def _sync_channel(conn, channel: str, days: int) -> int:
+    channel_id = await _channel_id(channel)
+    oldest, latest = _sync_window(conn, channel_id, days)
+    history = await _list_all(
+        "conversations.history", "messages", channel=channel_id, oldest=oldest
+    )
+    threads = await asyncio.gather(
+        *(_thread_replies(channel_id, ts) for ts in _thread_roots(history))
+    )
+    replies = [m for thread in threads for m in thread]
+    _store(
+        conn, channel_id, _channel_name(channel, channel_id),
+        history, replies, oldest, latest,
+    )
+    return len(history) + len(replies)
+
+
+async def sync_mirror() -> dict:
+    """Pull new and recently changed messages for every mirrored channel."""
+    config = _mirror_config()
+    await _ensure_loaded(_users, _load_users)
+    fetched: dict[str, int] = {}
+    async with _sync_lock.get():
+        with closing(_connect()) as conn:
+            for channel in config.mirror_channels:
+                fetched[channel] = await _sync_channel(
+                    conn, channel, config.mirror_days
+                )
+        _mark_synced()
+    return {"fetched": fetched}
+
+
+async def _background_sync() -> None:
+    try:
+        with retry.budget():
+            await sync_mirror()
+    except Exception:
+        logger.warning("Slack mirror sync failed", exc_info=True)
+    finally:
+        _end_sync()
+
+
+async def search_mirror(query: str, max_results: int = 20) -> dict:
+    """Search the mirrored channels locally; a stale mirror syncs in the background.
+
+    Returns the same channel/thread grouping as search_messages, without
+    thread expansion. ``syncing`` is true while a sync runs, so a first
+    search may come back empty.
+    """
+    _mirror_config()
+    if _begin_sync():
+        task = asyncio.create_task(_background_sync())
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+    with closing(_connect()) as conn:
+        return _search(conn, query, max_results)
@@ -1,9 +1,9 @@
 """Ashby ATS API client — candidate search, feedback, stage changes."""
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from ..config import AshbyConfig
+from . import http
 
 
 def _get_config() -> AshbyConfig:
@@ -13,10 +13,11 @@ def _get_config() -> AshbyConfig:
     return config
 
 
-def _post(endpoint: str, payload: dict) -> dict:
+def _post(endpoint: str, payload: dict, idempotent: bool = False) -> dict:
     config = _get_config()
-    resp = requests.post(
-        f"{config.base_url}/{endpoint}",
+    resp = http.request(
+        "ashby", "POST", f"{config.base_url}/{endpoint}",
+        idempotent=idempotent,
         json=payload,
         auth=HTTPBasicAuth(config.api_key, ""),
         headers={"Content-Type": "application/json"},
@@ -27,39 +28,45 @@ def _post(endpoint: str, payload: dict) -> dict:
 
 def search_candidates(name: str) -> list[dict]:
     """Search candidates by name."""
-    data = _post("candidate.search", {"name": name})
+    data = _post("candidate.search", {"name": name}, idempotent=True)
     return data.get("results", [])
 
 
 def get_application(application_id: str) -> dict:
     """Get application details including current stage."""
-    data = _post("application.info", {"applicationId": application_id})
+    data = _post(
+        "application.info", {"applicationId": application_id}, idempotent=True
+    )
     return data.get("results", data)
 
 
 def list_interview_stages(interview_plan_id: str) -> list[dict]:
     """List ordered stages for an interview plan."""
-    data = _post("interviewStage.list", {"interviewPlanId": interview_plan_id})
+    data = _post(
+        "interviewStage.list", {"interviewPlanId": interview_plan_id},
+        idempotent=True,
+    )
     return data.get("results", [])
 
 
 def list_archive_reasons() -> list[dict]:
     """List available archive/rejection reasons."""
-    data = _post("archiveReason.list", {})
+    data = _post("archiveReason.list", {}, idempotent=True)
     return data.get("results", [])
 
 
 def list_interview_schedules(application_id: str) -> list[dict]:
     """List interview schedules for an application."""
     data = _post(
-        "interviewSchedule.list", {"applicationId": application_id}
+        "interviewSchedule.list", {"applicationId": application_id},
+        idempotent=True,
     )
     return data.get("results", [])
 
 
 def get_interview(interview_id: str) -> dict:
     """Get interview details including feedback form definition."""
-    data = _post("interview.info", {"id": interview_id})
+    data = _post("interview.info", {"id": interview_id}, idempotent=True)
     return data.get("results", data)
 
 
@@ -68,24 +75,14 @@ def get_feedback_form_definition(form_definition_id: str) -> dict:
     data = _post(
         "feedbackFormDefinition.info",
         {"feedbackFormDefinitionId": form_definition_id},
+        idempotent=True,
     )
     return data.get("results", data)
 
 
-def submit_feedback(
-    application_id: str,
-    summary: str,
-    score: int,
-    recommendation: str,
-) -> dict:
-    """Submit interview scorecard feedback.
-
-    Discovers the pending interview event and feedback form automatically,
-    then submits the overall recommendation plus summary text in the
-    Red Flag / Gold Flag or general Feedback fields.
-    """
-    # 1. Find the pending interview event
-    schedules = list_interview_schedules(application_id)
+def _find_pending_event(schedules: list[dict]) -> tuple[str, str, str | None]:
+    """Return (interview event ID, interview ID, interviewer user ID) of the
+    first interview event still awaiting feedback."""
     interview_event_id = None
     interview_id = None
     user_id = None
@@ -106,17 +103,29 @@ def submit_feedback(
             "No pending interview event found for this application. "
             "Feedback may have already been submitted."
         )
+    return interview_event_id, interview_id, user_id
 
-    # 2. Get the feedback form definition from the interview
-    interview_info = get_interview(interview_id)
+
+def _form_definition_id(interview_info: dict, interview_id: str) -> str:
     form_def_id = interview_info.get("feedbackFormDefinitionId")
     if not form_def_id:
         raise ValueError(
             f"No feedback form definition found for interview {interview_id}"
         )
+    return form_def_id
 
-    # 3. Get form fields to find the right paths
-    form_def = get_feedback_form_definition(form_def_id)
+
+def _feedback_payload(
+    application_id: str,
+    summary: str,
+    score: int,
+    interview_event_id: str,
+    user_id: str | None,
+    form_def_id: str,
+    form_def: dict,
+) -> dict:
+    """Build the applicationFeedback.submit payload from the form definition."""
+    # Find the recommendation and free-text field paths
     recommendation_path = None
     richtext_paths: list[str] = []
     for section in form_def.get("sections", []):
@@ -129,7 +138,6 @@ def submit_feedback(
     if not recommendation_path:
         recommendation_path = "overall_recommendation"
 
-    # 4. Build field submissions
     field_submissions = [
         {"path": recommendation_path, "value": str(score)},
     ]
@@ -140,7 +148,6 @@ def submit_feedback(
             "value": {"type": "PlainText", "value": summary},
         })
 
-    # 5. Submit
     payload: dict = {
         "applicationId": application_id,
         "formDefinitionId": form_def_id,
@@ -149,7 +156,36 @@ def submit_feedback(
     }
     if user_id:
         payload["userId"] = user_id
+    return payload
+
+
+def submit_feedback(
+    application_id: str,
+    summary: str,
+    score: int,
+    recommendation: str,
+) -> dict:
+    """Submit interview scorecard feedback.
+
+    Discovers the pending interview event and feedback form automatically,
+    then submits the overall recommendation plus summary text in the
+    Red Flag / Gold Flag or general Feedback fields.
+    """
+    # 1. Find the pending interview event
+    schedules = list_interview_schedules(application_id)
+    interview_event_id, interview_id, user_id = _find_pending_event(schedules)
+
+    # 2. Get the feedback form definition from the interview
+    form_def_id = _form_definition_id(get_interview(interview_id), interview_id)
+
+    # 3. Get form fields and build the submission
+    form_def = get_feedback_form_definition(form_def_id)
+    payload = _feedback_payload(
+        application_id, summary, score, interview_event_id, user_id,
+        form_def_id, form_def,
+    )
 
+    # 4. Submit
     data = _post("applicationFeedback.submit", payload)
     return data.get("results", data)
 
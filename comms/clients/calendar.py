@@ -2,16 +2,13 @@
 
 from datetime import datetime, timedelta
 
-from googleapiclient.discovery import build
-
-from ..config import GoogleConfig, CALENDAR_SCOPES, CALENDAR_WRITE_SCOPES
+from ..config import CALENDAR_SCOPES, CALENDAR_WRITE_SCOPES
+from .google import get_service
 
 
 def _get_service(write=False):
-    config = GoogleConfig()
     scopes = CALENDAR_WRITE_SCOPES if write else CALENDAR_SCOPES
-    creds = config.get_credentials(scopes)
-    return build("calendar", "v3", credentials=creds)
+    return get_service("calendar", "v3", scopes)
 
 
 def _format_event(event: dict) -> dict:
@@ -1,26 +1,23 @@
 """Google Drive API client — search files, read documents."""
 
-from googleapiclient.discovery import build
-
-from ..config import GoogleConfig, DRIVE_SCOPES
+from ..config import DRIVE_SCOPES, SHEETS_SCOPES
+from .google import get_service
 
 
 def _get_service():
-    config = GoogleConfig()
-    creds = config.get_credentials(DRIVE_SCOPES)
-    return build("drive", "v3", credentials=creds)
+    return get_service("drive", "v3", DRIVE_SCOPES)
 
 
 def _get_docs_service():
-    config = GoogleConfig()
-    creds = config.get_credentials(DRIVE_SCOPES)
-    return build("docs", "v1", credentials=creds)
+    return get_service("docs", "v1", DRIVE_SCOPES)
 
 
 def _get_slides_service():
-    config = GoogleConfig()
-    creds = config.get_credentials(DRIVE_SCOPES)
-    return build("slides", "v1", credentials=creds)
+    return get_service("slides", "v1", DRIVE_SCOPES)
+
+
+def _get_sheets_service():
+    return get_service("sheets", "v4", SHEETS_SCOPES)
 
 
 def search_files(query: str, max_results: int = 20) -> list[dict]:
@@ -93,10 +90,7 @@ def read_file(file_id: str) -> dict:
         doc = docs_service.documents().get(documentId=file_id).execute()
         result["content"] = _extract_doc_text(doc)
     elif mime == "application/vnd.google-apps.spreadsheet":
-        from ..config import SHEETS_SCOPES
-        config = GoogleConfig()
-        creds = config.get_credentials(SHEETS_SCOPES)
-        sheets_service = build("sheets", "v4", credentials=creds)
+        sheets_service = _get_sheets_service()
         sheet_data = sheets_service.spreadsheets().values().get(
             spreadsheetId=file_id, range="Sheet1!A:Z"
         ).execute()
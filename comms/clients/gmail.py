@@ -1,34 +1,223 @@
 """Gmail API client — search, read, draft, send."""
 
 import base64
+import contextvars
+import hashlib
+import itertools
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
-from typing import Any
+from html.parser import HTMLParser
+from typing import Any, Callable, Iterator
 
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
-from ..config import GoogleConfig, GMAIL_SCOPES
+from ..config import GMAIL_SCOPES
+from . import ratelimit, retry
+from .google import get_service, split_method_id
+
+
+_METADATA_HEADERS = ["Subject", "From", "To", "Cc", "Date"]
+
+# Gmail accepts up to 100 calls per batch request.
+_BATCH_SIZE = 100
+
+# messages.batchModify accepts at most 1000 IDs per call.
+_MODIFY_BATCH_SIZE = 1000
+
+# messages.list returns at most 500 IDs per page.
+_LIST_PAGE_SIZE = 500
+
+# Full threads are reused for a short while so read_thread followed by
+# draft_email on the same thread costs a single fetch.
+_THREAD_CACHE_TTL = 300.0
+# Full threads can run to megabytes; keep only the most recent few.
+_THREAD_CACHE_SIZE = 32
+
+_thread_cache: dict[str, tuple[float, dict]] = {}
+_message_threads: dict[str, str] = {}
+_thread_cache_lock = threading.Lock()
+
+# Prefetches the next list page while the current page's metadata batch runs.
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gmail-pager")
 
 
 def _get_service():
-    config = GoogleConfig()
-    creds = config.get_credentials(GMAIL_SCOPES)
-    return build("gmail", "v1", credentials=creds)
-
-
-def _get_plain_text_body(payload: dict) -> str:
-    """Recursively extract plain-text body from a Gmail message payload."""
-    if "parts" in payload:
-        for part in payload["parts"]:
-            body = _get_plain_text_body(part)
-            if body:
-                return body
-    else:
-        mime_type = payload.get("mimeType", "")
-        if mime_type == "text/plain":
-            data = payload.get("body", {}).get("data")
-            if data:
-                return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
-    return ""
+    return get_service("gmail", "v1", GMAIL_SCOPES)
+
+
+def _execute_batch(
+    service,
+    requests: list[Callable[[], Any]],
+    indexes: list[int],
+    callback: Callable,
+) -> None:
+    batch = service.new_batch_http_request(callback=callback)
+    units = 0.0
+    for index in indexes:
+        request = requests[index]()
+        units += ratelimit.bucket_and_cost(*split_method_id(request.methodId))[1]
+        batch.add(request, request_id=str(index))
+    # Each sub-request counts against the per-user quota.
+    ratelimit.acquire("gmail", cost=units)
+    batch.execute()
+
+
+def _batch_execute(service, requests: list[Callable[[], Any]]) -> list[Any]:
+    """Run requests through the Gmail batch endpoint, preserving order.
+
+    Each entry is a zero-argument factory returning an HttpRequest, so
+    throttled sub-requests can be rebuilt and retried on their own under
+    the shared retry policy; a batch call that fails as a whole is rebuilt
+    and retried the same way.
+    Returns one response per request, or the exception it failed with.
+    """
+    results: list[Any] = [None] * len(requests)
+    pending = list(range(len(requests)))
+
+    for attempt in itertools.count(1):
+        throttled: list[int] = []
+
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None and retry.is_throttled(exception):
+                throttled.append(index)
+                results[index] = exception
+            elif exception is not None:
+                results[index] = exception
+            else:
+                results[index] = response
+
+        for start in range(0, len(pending), _BATCH_SIZE):
+            indexes = pending[start:start + _BATCH_SIZE]
+            retry.call(
+                "gmail",
+                lambda indexes=indexes: _execute_batch(
+                    service, requests, indexes, callback
+                ),
+            )
+
+        if not throttled:
+            break
+        pending = sorted(throttled)
+        if not retry.wait("gmail", attempt, f"{len(pending)} throttled batch requests"):
+            break
+
+    return results
+
+
+def _get_metadata(service, message_ids: list[str]) -> list[dict]:
+    """Fetch message metadata for many IDs in batches, in the given order."""
+    requests = [
+        lambda message_id=message_id: service.users().messages().get(
+            userId="me", id=message_id, format="metadata",
+            metadataHeaders=_METADATA_HEADERS,
+        )
+        for message_id in message_ids
+    ]
+    results = _batch_execute(service, requests)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
+class _HTMLText(HTMLParser):
+    """Collects readable text from an HTML body."""
+
+    _SKIP = {"script", "style", "head"}
+    _BLOCK = {
+        "br", "p", "div", "tr", "li", "blockquote",
+        "h1", "h2", "h3", "h4", "h5", "h6",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip_depth += 1
+        elif tag in self._BLOCK:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self._BLOCK:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _html_to_text(html: str) -> str:
+    parser = _HTMLText()
+    parser.feed(html)
+    parser.close()
+    lines = (" ".join(line.split()) for line in "".join(parser.parts).splitlines())
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _index_parts(payload: dict) -> dict[str, Any]:
+    """Walk the MIME tree once, depth-first in part order.
+
+    Returns the first text/plain and text/html body parts and metadata for
+    every attachment, without decoding anything.
+    """
+    plain = html = None
+    attachments = []
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        children = part.get("parts")
+        if children:
+            stack.extend(reversed(children))
+            continue
+        mime_type = part.get("mimeType", "")
+        body = part.get("body", {})
+        if part.get("filename"):
+            attachments.append({
+                "filename": part["filename"],
+                "mimeType": mime_type,
+                "size": body.get("size", 0),
+            })
+        elif mime_type == "text/plain" and plain is None and body.get("data"):
+            plain = part
+        elif mime_type == "text/html" and html is None and body.get("data"):
+            html = part
+    return {"plain": plain, "html": html, "attachments": attachments}
+
+
+def _decode_part(part: dict, max_bytes: int | None = None) -> tuple[str, bool]:
+    """Decode a body part, at most ``max_bytes`` of it. Returns (text, truncated)."""
+    data = part["body"]["data"]
+    truncated = False
+    if max_bytes is not None:
+        # Every 4 base64 characters decode to 3 bytes.
+        limit = -(-max_bytes // 3) * 4
+        if len(data) > limit:
+            data = data[:limit]
+            truncated = True
+    raw = base64.urlsafe_b64decode(data)
+    if len(raw) > (max_bytes or len(raw)):
+        raw = raw[:max_bytes]
+        truncated = True
+    return raw.decode("utf-8", errors="replace"), truncated
+
+
+def _body_text(index: dict, max_bytes: int | None = None) -> tuple[str, bool]:
+    """Plain-text body from a part index, falling back to converted HTML."""
+    if index["plain"] is not None:
+        return _decode_part(index["plain"], max_bytes)
+    if index["html"] is not None:
+        html, truncated = _decode_part(index["html"], max_bytes)
+        return _html_to_text(html), truncated
+    return "", False
 
 
 def _header(headers: list[dict], name: str) -> str:
@@ -53,63 +242,300 @@ def _format_message(msg: dict) -> dict[str, Any]:
     }
 
 
-def _format_message_full(msg: dict) -> dict[str, Any]:
+# Reply attribution lines that introduce quoted history, e.g.
+# "On Mon, Jan 6, 2025 at 9:14 AM Jane <jane@example.com> wrote:".
+_ATTRIBUTION = re.compile(
+    r"^\s*(On\b.*\bwrote:|-{2,}\s*Original Message\s*-{2,})\s*$", re.IGNORECASE
+)
+
+
+def _paragraph_key(paragraph: str) -> str:
+    normalized = " ".join(paragraph.split()).lower()
+    if not normalized:
+        return ""
+    return hashlib.sha1(normalized.encode()).hexdigest()
+
+
+def _paragraphs(lines: list[str]) -> list[str]:
+    text = "\n".join(lines)
+    return [p.strip("\n") for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+
+def _strip_quoted_history(body: str, seen: set[str]) -> str:
+    """Drop quoted history: ``>`` lines, attributions, and repeated quoted text.
+
+    Text above the first attribution line is the message's own and is always
+    kept. Below it, paragraphs already in ``seen`` are dropped. Kept
+    paragraphs are added to ``seen``. If nothing would remain, the body is
+    returned unchanged.
+    """
+    lines = body.splitlines()
+    own: list[str] = []
+    quoted: list[str] = []
+    region = own
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        # Attributions are often wrapped onto a second line.
+        joined = line + " " + lines[i + 1] if i + 1 < len(lines) else line
+        if _ATTRIBUTION.match(line):
+            region = quoted
+            i += 1
+            continue
+        if line.lstrip().startswith("On ") and _ATTRIBUTION.match(joined):
+            region = quoted
+            i += 2
+            continue
+        if not line.lstrip().startswith(">"):
+            region.append(line)
+        i += 1
+
+    kept = _paragraphs(own)
+    for paragraph in _paragraphs(quoted):
+        if _paragraph_key(paragraph) not in seen:
+            kept.append(paragraph)
+    if not kept:
+        return body
+    seen.update(_paragraph_key(paragraph) for paragraph in kept)
+    return "\n\n".join(kept)
+
+
+def _format_message_full(msg: dict, max_body_bytes: int | None = None) -> dict[str, Any]:
     result = _format_message(msg)
-    result["body"] = _get_plain_text_body(msg.get("payload", {}))
-    # List attachment names
-    attachments = []
-    for part in msg.get("payload", {}).get("parts", []):
-        filename = part.get("filename")
-        if filename:
-            attachments.append(filename)
-    result["attachments"] = attachments
+    index = _index_parts(msg.get("payload", {}))
+    body, truncated = _body_text(index, max_body_bytes)
+    result["body"] = body
+    if truncated:
+        result["bodyTruncated"] = True
+    result["attachments"] = index["attachments"]
     return result
 
 
+def _list_page(resource: str, query: str, page_token: str, page_size: int) -> dict:
+    """List one page of ``messages`` or ``threads`` matching a query."""
+    service = _get_service()
+    kwargs: dict[str, Any] = {"userId": "me", "q": query, "maxResults": page_size}
+    if page_token:
+        kwargs["pageToken"] = page_token
+    return getattr(service.users(), resource)().list(**kwargs).execute()
+
+
+def _iter_id_pages(
+    query: str, limit: int | None = None, resource: str = "messages"
+) -> Iterator[list[str]]:
+    """Yield pages of message (or thread) IDs, following page tokens.
+
+    The next page is requested in the background before the current one is
+    handed to the caller. Stops after ``limit`` IDs if given.
+    """
+    remaining = limit
+
+    def page_size() -> int:
+        if remaining is None:
+            return _LIST_PAGE_SIZE
+        return min(remaining, _LIST_PAGE_SIZE)
+
+    if remaining is not None and remaining <= 0:
+        return
+    page = _list_page(resource, query, "", page_size())
+    while True:
+        ids = [item["id"] for item in page.get(resource, [])]
+        if remaining is not None:
+            ids = ids[:remaining]
+            remaining -= len(ids)
+
+        next_page = None
+        page_token = page.get("nextPageToken")
+        if page_token and (remaining is None or remaining > 0):
+            # Run in a copy of this context so the tool call's retry budget applies.
+            next_page = _prefetch_executor.submit(
+                contextvars.copy_context().run,
+                _list_page, resource, query, page_token, page_size(),
+            )
+
+        yield ids
+
+        if next_page is None:
+            return
+        page = next_page.result()
+
+
+def iter_message_ids(query: str, limit: int | None = None) -> Iterator[str]:
+    """Yield IDs of messages matching a query, across all list pages."""
+    for message_ids in _iter_id_pages(query, limit):
+        yield from message_ids
+
+
+def iter_messages(query: str, limit: int | None = None) -> Iterator[dict]:
+    """Yield message summaries matching a query, following page tokens.
+
+    The next list page is fetched while the current page's metadata batch
+    runs. Stops after ``limit`` messages if given.
+    """
+    service = _get_service()
+    for message_ids in _iter_id_pages(query, limit):
+        for msg in _get_metadata(service, message_ids):
+            yield _format_message(msg)
+
+
 def search_emails(query: str, max_results: int = 20) -> list[dict]:
     """Search Gmail with query syntax. Returns message summaries."""
-    service = _get_service()
-    resp = service.users().messages().list(
-        userId="me", q=query, maxResults=max_results
-    ).execute()
+    return list(itertools.islice(iter_messages(query, limit=max_results), max_results))
+
+
+def _latest_received(messages: list[dict]) -> dict:
+    """Latest inbox message, else the latest one; drafts are never chosen."""
+    for msg in reversed(messages):
+        if "INBOX" in msg.get("labelIds", []):
+            return msg
+    return messages[-1] if messages else {}
+
+
+def _summarize_thread(thread: dict) -> dict[str, Any]:
+    messages = [
+        msg for msg in thread.get("messages", [])
+        if "DRAFT" not in msg.get("labelIds", [])
+    ]
+    latest = _latest_received(messages)
+    headers = latest.get("payload", {}).get("headers", [])
+    return {
+        "threadId": thread["id"],
+        "latestMessageId": latest.get("id", ""),
+        "from": _header(headers, "From"),
+        "subject": _header(headers, "Subject"),
+        "date": _header(headers, "Date"),
+        "snippet": latest.get("snippet", ""),
+        "messageCount": len(messages),
+        "labelIds": latest.get("labelIds", []),
+    }
+
 
-    messages = resp.get("messages", [])
-    if not messages:
-        return []
+def list_threads(query: str = "in:inbox", max_results: int = 100) -> list[dict]:
+    """List threads matching a query, one row per thread.
 
+    Each row describes the thread's latest inbox message (the latest
+    message when none is in the inbox) plus the message count. Drafts are
+    left out of both.
+    """
+    service = _get_service()
     results = []
-    for m in messages:
-        msg = service.users().messages().get(
-            userId="me", id=m["id"], format="metadata",
-            metadataHeaders=["Subject", "From", "To", "Cc", "Date"],
-        ).execute()
-        results.append(_format_message(msg))
+    for thread_ids in _iter_id_pages(query, max_results, resource="threads"):
+        requests = [
+            lambda thread_id=thread_id: service.users().threads().get(
+                userId="me", id=thread_id, format="metadata",
+                metadataHeaders=["Subject", "From", "Date"],
+            )
+            for thread_id in thread_ids
+        ]
+        for thread in _batch_execute(service, requests):
+            if isinstance(thread, Exception):
+                raise thread
+            results.append(_summarize_thread(thread))
     return results
 
 
-def read_email(message_id: str) -> dict:
-    """Read a specific message by ID. Full body + headers + attachments."""
+def _cached_thread(thread_id: str, min_history_id: str = "") -> dict | None:
+    with _thread_cache_lock:
+        entry = _thread_cache.get(thread_id)
+    if entry is None:
+        return None
+    fetched_at, thread = entry
+    if time.monotonic() - fetched_at > _THREAD_CACHE_TTL:
+        return None
+    if min_history_id and int(thread.get("historyId", 0)) < int(min_history_id):
+        return None
+    return thread
+
+
+def _get_thread(service, thread_id: str, min_history_id: str = "") -> dict:
+    """Full thread, served from the short-lived cache when still current."""
+    thread = _cached_thread(thread_id, min_history_id)
+    if thread is not None:
+        return thread
+    thread = service.users().threads().get(
+        userId="me", id=thread_id, format="full"
+    ).execute()
+    with _thread_cache_lock:
+        _thread_cache.pop(thread_id, None)
+        _thread_cache[thread_id] = (time.monotonic(), thread)
+        for msg in thread.get("messages", []):
+            _message_threads[msg["id"]] = thread_id
+        _evict_threads()
+    return thread
+
+
+def _evict_threads() -> None:
+    """Drop expired threads and the oldest beyond the size cap (lock held)."""
+    now = time.monotonic()
+    expired = [
+        thread_id for thread_id, (fetched_at, _) in _thread_cache.items()
+        if now - fetched_at > _THREAD_CACHE_TTL
+    ]
+    live = [t for t in _thread_cache if t not in set(expired)]
+    expired.extend(live[:max(0, len(live) - _THREAD_CACHE_SIZE)])
+    for thread_id in expired:
+        del _thread_cache[thread_id]
+    if expired:
+        for message_id, thread_id in list(_message_threads.items()):
+            if thread_id not in _thread_cache:
+                del _message_threads[message_id]
+
+
+def _current_thread(service, thread_id: str) -> dict:
+    """Full thread; a cached copy is reused only if its historyId is current."""
+    if _cached_thread(thread_id) is None:
+        return _get_thread(service, thread_id)
+    latest = service.users().threads().get(
+        userId="me", id=thread_id, format="minimal", fields="historyId"
+    ).execute()
+    return _get_thread(service, thread_id, latest.get("historyId", ""))
+
+
+def _invalidate_thread(thread_id: str) -> None:
+    with _thread_cache_lock:
+        _thread_cache.pop(thread_id, None)
+
+
+def read_email(message_id: str, max_body_bytes: int | None = None) -> dict:
+    """Read a specific message by ID. Full body + headers + attachments.
+
+    ``max_body_bytes`` caps the decoded body size per message.
+    """
     service = _get_service()
     msg = service.users().messages().get(
         userId="me", id=message_id, format="full"
     ).execute()
-    return _format_message_full(msg)
+    return _format_message_full(msg, max_body_bytes)
 
 
-def read_thread(thread_id: str) -> list[dict]:
-    """Read entire email thread by threadId. All messages chronologically."""
+def read_thread(
+    thread_id: str,
+    max_body_bytes: int | None = None,
+    dedupe_quotes: bool = False,
+) -> list[dict]:
+    """Read entire email thread by threadId. All messages chronologically.
+
+    ``max_body_bytes`` caps the decoded body size per message. With
+    ``dedupe_quotes``, each body keeps only content not already seen earlier
+    in the thread, and reports the bytes removed as ``bytesSaved``.
+    """
     service = _get_service()
-    thread = service.users().threads().get(
-        userId="me", id=thread_id, format="full"
-    ).execute()
-    return [_format_message_full(msg) for msg in thread.get("messages", [])]
+    thread = _current_thread(service, thread_id)
+    results = [
+        _format_message_full(msg, max_body_bytes)
+        for msg in thread.get("messages", [])
+    ]
+    if dedupe_quotes:
+        seen: set[str] = set()
+        for result in results:
+            original = result["body"]
+            result["body"] = _strip_quoted_history(original, seen)
+            result["bytesSaved"] = len(original.encode()) - len(result["body"].encode())
+    return results
 
 
-def _build_quoted_thread(service, thread_id: str, reply_to_message_id: str) -> str:
+def _build_quoted_thread(thread: dict, reply_to_message_id: str) -> str:
     """Build quoted text from all messages in the thread up to and including the reply-to message."""
-    thread = service.users().threads().get(
-        userId="me", id=thread_id, format="full"
-    ).execute()
     messages = thread.get("messages", [])
 
     quoted_parts = []
@@ -120,7 +546,7 @@ def _build_quoted_thread(service, thread_id: str, reply_to_message_id: str) -> s
         headers = msg.get("payload", {}).get("headers", [])
         msg_from = _header(headers, "From")
         msg_date = _header(headers, "Date")
-        msg_body = _get_plain_text_body(msg.get("payload", {})).strip()
+        msg_body = _body_text(_index_parts(msg.get("payload", {})))[0].strip()
         if msg_body:
             quoted_lines = "\n".join(f"> {line}" for line in msg_body.splitlines())
             quoted_parts.append(f"On {msg_date}, {msg_from} wrote:\n{quoted_lines}")
@@ -144,19 +570,33 @@ def draft_email(
     thread_id = None
 
     if reply_to_message_id:
-        # Fetch original message for threading headers
-        orig = service.users().messages().get(
-            userId="me", id=reply_to_message_id, format="metadata",
-            metadataHeaders=["Subject", "Message-ID"],
-        ).execute()
+        # Use the cached thread when it holds the original message; otherwise
+        # fetch the original for its threadId and threading headers.
+        orig = None
+        with _thread_cache_lock:
+            cached_thread_id = _message_threads.get(reply_to_message_id)
+        thread = _cached_thread(cached_thread_id) if cached_thread_id else None
+        if thread is not None:
+            orig = next(
+                (m for m in thread.get("messages", []) if m["id"] == reply_to_message_id),
+                None,
+            )
+        if orig is None:
+            orig = service.users().messages().get(
+                userId="me", id=reply_to_message_id, format="metadata",
+                metadataHeaders=["Subject", "Message-ID"],
+            ).execute()
+            thread = None
         thread_id = orig.get("threadId")
         if thread_id:
             draft_body["message"]["threadId"] = thread_id
 
-        # Build quoted thread and append to body
-        quoted = _build_quoted_thread(service, thread_id, reply_to_message_id)
-        if quoted:
-            body = body.rstrip() + "\n\n" + quoted
+            # Build quoted thread and append to body
+            if thread is None:
+                thread = _get_thread(service, thread_id, orig.get("historyId", ""))
+            quoted = _build_quoted_thread(thread, reply_to_message_id)
+            if quoted:
+                body = body.rstrip() + "\n\n" + quoted
 
     message = MIMEText(body)
     message["to"] = to
@@ -175,6 +615,8 @@ def draft_email(
     draft_body["message"]["raw"] = raw
 
     draft = service.users().drafts().create(userId="me", body=draft_body).execute()
+    if thread_id:
+        _invalidate_thread(thread_id)
     return {
         "draftId": draft["id"],
         "messageId": draft["message"]["id"],
@@ -188,6 +630,8 @@ def send_draft(draft_id: str) -> dict:
     result = service.users().drafts().send(
         userId="me", body={"id": draft_id}
     ).execute()
+    if result.get("threadId"):
+        _invalidate_thread(result["threadId"])
     return {
         "messageId": result["id"],
         "threadId": result.get("threadId", ""),
@@ -209,9 +653,85 @@ def archive_email(message_id: str) -> dict:
         id=thread_id,
         body={"removeLabelIds": ["INBOX"]},
     ).execute()
+    _invalidate_thread(thread_id)
     return {"status": "archived", "messageId": message_id, "threadId": thread_id}
 
 
+def archive_emails(ids: list[str]) -> list[dict]:
+    """Archive many threads, given message or thread IDs.
+
+    Resolves thread IDs in batch requests, then removes INBOX from every
+    message in those threads with messages.batchModify. Returns one result
+    per input ID.
+    """
+    service = _get_service()
+    ids = list(dict.fromkeys(ids))
+
+    # 1. Resolve each ID to a thread; IDs that are not messages are tried
+    # as thread IDs.
+    resolved = _batch_execute(service, [
+        lambda item=item: service.users().messages().get(
+            userId="me", id=item, format="minimal", fields="id,threadId",
+        )
+        for item in ids
+    ])
+    thread_for: dict[str, str] = {}
+    for item, msg in zip(ids, resolved):
+        thread_for[item] = item if isinstance(msg, Exception) else msg["threadId"]
+
+    # 2. Collect the inbox messages of each thread.
+    thread_ids = list(dict.fromkeys(thread_for.values()))
+    threads = _batch_execute(service, [
+        lambda thread_id=thread_id: service.users().threads().get(
+            userId="me", id=thread_id, format="minimal",
+            fields="id,messages(id,labelIds)",
+        )
+        for thread_id in thread_ids
+    ])
+    errors: dict[str, str] = {}
+    messages_for: dict[str, list[str]] = {}
+    for thread_id, thread in zip(thread_ids, threads):
+        if isinstance(thread, Exception):
+            errors[thread_id] = str(thread)
+            continue
+        messages_for[thread_id] = [
+            m["id"] for m in thread.get("messages", [])
+            if "INBOX" in m.get("labelIds", [])
+        ]
+
+    # 3. Remove INBOX in as few calls as possible.
+    message_ids = [m for ms in messages_for.values() for m in ms]
+    failed_messages: dict[str, str] = {}
+    for start in range(0, len(message_ids), _MODIFY_BATCH_SIZE):
+        chunk = message_ids[start:start + _MODIFY_BATCH_SIZE]
+        try:
+            service.users().messages().batchModify(
+                userId="me",
+                body={"ids": chunk, "removeLabelIds": ["INBOX"]},
+            ).execute()
+        except HttpError as e:
+            failed_messages.update(dict.fromkeys(chunk, str(e)))
+
+    for thread_id, thread_messages in messages_for.items():
+        _invalidate_thread(thread_id)
+        for message_id in thread_messages:
+            if message_id in failed_messages:
+                errors[thread_id] = failed_messages[message_id]
+                break
+
+    results = []
+    for item in ids:
+        thread_id = thread_for[item]
+        if thread_id in errors:
+            results.append({
+                "id": item, "threadId": thread_id,
+                "status": "error", "error": errors[thread_id],
+            })
+        else:
+            results.append({"id": item, "threadId": thread_id, "status": "archived"})
+    return results
+
+
 def send_email(
     to: str,
     subject: str,
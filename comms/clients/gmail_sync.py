@@ -0,0 +1,239 @@
+"""Incremental Gmail inbox sync — local SQLite snapshot kept current via the History API."""
+
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Any
+
+from googleapiclient.errors import HttpError
+
+from ..config import CacheConfig, GoogleConfig
+from .gmail import (
+    _METADATA_HEADERS,
+    _batch_execute,
+    _format_message,
+    _get_service,
+    iter_message_ids,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY,
+    thread_id TEXT NOT NULL,
+    internal_date INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_internal_date ON messages (internal_date);
+"""
+
+# IDs per IN (...) lookup; older SQLite builds allow only 999 bound variables.
+_LOOKUP_CHUNK = 500
+
+_sync_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    cache_dir = CacheConfig().cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    user = GoogleConfig().delegated_user
+    conn = sqlite3.connect(cache_dir / f"gmail-inbox-{user}.sqlite3")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _fetch_metadata(service, message_ids: list[str]) -> list[dict]:
+    """Batch-fetch metadata, skipping messages deleted since they were listed."""
+    requests = [
+        lambda message_id=message_id: service.users().messages().get(
+            userId="me", id=message_id, format="metadata",
+            metadataHeaders=_METADATA_HEADERS,
+        )
+        for message_id in message_ids
+    ]
+    messages = []
+    for result in _batch_execute(service, requests):
+        if isinstance(result, HttpError) and result.resp.status == 404:
+            continue
+        if isinstance(result, Exception):
+            raise result
+        messages.append(result)
+    return messages
+
+
+def _store(conn: sqlite3.Connection, messages: list[dict]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO messages (id, thread_id, internal_date, data) "
+        "VALUES (?, ?, ?, ?)",
+        [
+            (
+                msg["id"],
+                msg["threadId"],
+                int(msg.get("internalDate", 0)),
+                json.dumps(_format_message(msg)),
+            )
+            for msg in messages
+        ],
+    )
+
+
+def _full_sync(service, conn: sqlite3.Connection) -> dict[str, Any]:
+    # Read the history ID first so changes made during the listing are
+    # replayed by the next incremental sync.
+    history_id = service.users().getProfile(userId="me").execute()["historyId"]
+    message_ids = list(iter_message_ids("in:inbox"))
+    messages = _fetch_metadata(service, message_ids)
+    with conn:
+        conn.execute("DELETE FROM messages")
+        _store(conn, messages)
+        conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES ('history_id', ?)",
+            (str(history_id),),
+        )
+    return {
+        "mode": "full",
+        "historyId": str(history_id),
+        "added": len(messages),
+        "removed": 0,
+        "updated": 0,
+        "total": len(messages),
+    }
+
+
+def _list_history(service, start_history_id: str) -> tuple[list[dict], str]:
+    records: list[dict] = []
+    page_token = ""
+    while True:
+        kwargs: dict[str, Any] = {"userId": "me", "startHistoryId": start_history_id}
+        if page_token:
+            kwargs["pageToken"] = page_token
+        resp = service.users().history().list(**kwargs).execute()
+        records.extend(resp.get("history", []))
+        page_token = resp.get("nextPageToken", "")
+        if not page_token:
+            return records, str(resp.get("historyId", start_history_id))
+
+
+def _stored_messages(conn: sqlite3.Connection, message_ids: list[str]) -> dict:
+    """Stored message data by ID, looked up a chunk of IDs at a time."""
+    stored: dict[str, dict] = {}
+    for i in range(0, len(message_ids), _LOOKUP_CHUNK):
+        chunk = message_ids[i:i + _LOOKUP_CHUNK]
+        rows = conn.execute(
+            f"SELECT id, data FROM messages WHERE id IN ({','.join('?' * len(chunk))})",
+            chunk,
+        )
+        stored.update((row[0], json.loads(row[1])) for row in rows)
+    return stored
+
+
+def _incremental_sync(
+    service, conn: sqlite3.Connection, start_history_id: str
+) -> dict[str, Any]:
+    records, history_id = _list_history(service, start_history_id)
+
+    # Latest known labels per changed message; None marks a deletion.
+    labels: dict[str, list[str] | None] = {}
+    for record in records:
+        for entry in record.get("messagesAdded", []):
+            msg = entry["message"]
+            labels[msg["id"]] = msg.get("labelIds", [])
+        for entry in record.get("messagesDeleted", []):
+            labels[entry["message"]["id"]] = None
+        for key in ("labelsAdded", "labelsRemoved"):
+            for entry in record.get(key, []):
+                msg = entry["message"]
+                if labels.get(msg["id"], []) is not None:
+                    labels[msg["id"]] = msg.get("labelIds", [])
+
+    existing = _stored_messages(conn, list(labels))
+
+    removed = [
+        message_id for message_id, label_ids in labels.items()
+        if message_id in existing and (label_ids is None or "INBOX" not in label_ids)
+    ]
+    to_fetch = [
+        message_id for message_id, label_ids in labels.items()
+        if message_id not in existing and label_ids and "INBOX" in label_ids
+    ]
+    updated = []
+    for message_id, label_ids in labels.items():
+        if message_id in existing and label_ids and "INBOX" in label_ids:
+            data = existing[message_id]
+            if data["labelIds"] != label_ids:
+                data["labelIds"] = label_ids
+                updated.append((json.dumps(data), message_id))
+
+    added = _fetch_metadata(service, to_fetch)
+    with conn:
+        conn.executemany("DELETE FROM messages WHERE id = ?", [(i,) for i in removed])
+        conn.executemany("UPDATE messages SET data = ? WHERE id = ?", updated)
+        _store(conn, added)
+        conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES ('history_id', ?)",
+            (history_id,),
+        )
+    total = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+    return {
+        "mode": "incremental",
+        "historyId": history_id,
+        "added": len(added),
+        "removed": len(removed),
+        "updated": len(updated),
+        "total": total,
+    }
+
+
+def _stored_history_id(conn: sqlite3.Connection) -> str | None:
+    row = conn.execute("SELECT value FROM state WHERE key = 'history_id'").fetchone()
+    return row[0] if row else None
+
+
+def sync_inbox(full: bool = False) -> dict:
+    """Bring the local inbox snapshot up to date.
+
+    Applies only the changes since the stored historyId. Falls back to a full
+    resync when there is no stored state, the history ID has expired, or
+    ``full`` is set.
+    """
+    service = _get_service()
+    with _sync_lock, closing(_connect()) as conn:
+        history_id = _stored_history_id(conn)
+        if history_id and not full:
+            try:
+                return _incremental_sync(service, conn, history_id)
+            except HttpError as e:
+                # 404 means the start history ID is too old to replay.
+                if e.resp.status != 404:
+                    raise
+        return _full_sync(service, conn)
+
+
+def search_inbox(max_results: int = 20) -> list[dict] | None:
+    """Inbox messages from the synced snapshot, newest first.
+
+    Brings an existing snapshot up to date incrementally, but never runs a
+    full sync: returns None when no snapshot has been taken with
+    sync_inbox or its history ID has expired, so the caller can query the
+    API instead.
+    """
+    service = _get_service()
+    with _sync_lock, closing(_connect()) as conn:
+        history_id = _stored_history_id(conn)
+        if not history_id:
+            return None
+        try:
+            _incremental_sync(service, conn, history_id)
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            return None
+        rows = conn.execute(
+            "SELECT data FROM messages ORDER BY internal_date DESC LIMIT ?",
+            (max_results,),
+        ).fetchall()
+    return [json.loads(row[0]) for row in rows]
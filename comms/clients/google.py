@@ -0,0 +1,106 @@
+"""Shared Google API service registry — build each discovery client once.
+
+Credentials are minted once per (scope set, delegated user) and shared; the
+auth transport refreshes them in place when they expire. Discovery documents
+are loaded from the static copies bundled with google-api-python-client and
+parsed once. Built services wrap an httplib2 connection, which is not
+thread-safe, so each worker thread keeps its own service per key.
+"""
+
+import json
+import threading
+from typing import Any
+
+from google.oauth2 import service_account
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import HttpRequest
+
+from ..config import GoogleConfig
+from . import ratelimit, retry
+
+_lock = threading.Lock()
+_credentials: dict[tuple, service_account.Credentials] = {}
+_documents: dict[tuple[str, str], dict] = {}
+_local = threading.local()
+
+
+def split_method_id(method_id: str | None) -> tuple[str, str]:
+    """Split "gmail.users.messages.get" into ("gmail", "users.messages.get")."""
+    upstream, _, method = (method_id or "google").partition(".")
+    return upstream, method
+
+
+class _RetryingHttpRequest(HttpRequest):
+    """HttpRequest whose execute() is rate limited and retried by shared policy."""
+
+    def execute(self, http=None, num_retries=0):
+        upstream, method = split_method_id(self.methodId)
+
+        def send():
+            ratelimit.acquire(upstream, method)
+            return super(_RetryingHttpRequest, self).execute(http=http)
+
+        return retry.call(upstream, send, idempotent=self.method == "GET")
+
+
+def _get_credentials(
+    config: GoogleConfig, scopes: tuple[str, ...]
+) -> service_account.Credentials:
+    key = (scopes, config.delegated_user)
+    with _lock:
+        creds = _credentials.get(key)
+        if creds is None:
+            creds = config.get_credentials(list(scopes))
+            _credentials[key] = creds
+        return creds
+
+
+def _get_document(api: str, version: str) -> dict | None:
+    key = (api, version)
+    with _lock:
+        if key not in _documents:
+            raw = get_static_doc(api, version)
+            _documents[key] = json.loads(raw) if raw else None
+        return _documents[key]
+
+
+def get_service(api: str, version: str, scopes: list[str]) -> Any:
+    """Return a cached discovery client for this thread.
+
+    Keyed by (api, version, scope set, delegated user).
+    """
+    config = GoogleConfig()
+    scope_key = tuple(sorted(scopes))
+    key = (api, version, scope_key, config.delegated_user)
+
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+    service = services.get(key)
+    if service is not None:
+        return service
+
+    creds = _get_credentials(config, scope_key)
+    document = _get_document(api, version)
+    # build_from_document fixes up the parsed document in place, so builds
+    # sharing a cached document are serialized.
+    with _lock:
+        if document is not None:
+            service = build_from_document(
+                document, credentials=creds, requestBuilder=_RetryingHttpRequest
+            )
+        else:
+            service = build(
+                api, version, credentials=creds, requestBuilder=_RetryingHttpRequest
+            )
+    services[key] = service
+    return service
+
+
+def clear() -> None:
+    """Drop cached credentials, documents and this thread's services."""
+    with _lock:
+        _credentials.clear()
+        _documents.clear()
+    _local.services = {}
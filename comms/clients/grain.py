@@ -1,10 +1,16 @@
 """Grain API client — list recordings, get transcript."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import requests
 
 from ..config import GrainConfig
+from . import http, transcript_cache, transcripts
+
+
+# A transcript can still change while its recording is processed, so it is
+# cached only once the recording ended at least this long ago.
+_TRANSCRIPT_SETTLE = timedelta(hours=2)
 
 
 def _get_config() -> GrainConfig:
@@ -22,63 +28,158 @@ def _headers(config: GrainConfig) -> dict:
     }
 
 
-def list_grain_recordings(date: str = "") -> list[dict]:
-    """List recordings for a date (YYYY-MM-DD). Defaults to today."""
-    config = _get_config()
-
+def _day_window(date: str) -> tuple[str, str]:
+    """ISO start/end bounds for a date (YYYY-MM-DD), defaulting to today."""
     if date:
         day = datetime.strptime(date, "%Y-%m-%d")
     else:
         day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return day.isoformat() + "Z", (day + timedelta(days=1)).isoformat() + "Z"
+
 
-    start = day.isoformat() + "Z"
-    end = (day + timedelta(days=1)).isoformat() + "Z"
+def _format_recording(rec: dict) -> dict:
+    return {
+        "id": rec.get("id", ""),
+        "title": rec.get("title", ""),
+        "start_datetime": rec.get("start_datetime", ""),
+        "end_datetime": rec.get("end_datetime", ""),
+        "duration": rec.get("duration", 0),
+        "participants": rec.get("participants", []),
+        "url": rec.get("url", ""),
+    }
+
+
+def _recordings_payload(start: str, end: str, cursor: str | None) -> dict:
+    """Recordings list request for [start, end); an empty end is open-ended."""
+    window = {"after_datetime": start}
+    if end:
+        window["before_datetime"] = end
+    payload: dict = {"include": {"participants": True}, "filter": window}
+    if cursor:
+        payload["cursor"] = cursor
+    return payload
+
+
+def _page_in_window(
+    recordings: list[dict], start: str, end: str
+) -> tuple[list[dict], bool]:
+    """Recordings of one page inside [start, end), and whether paging is done.
+
+    Pages are newest-first, so once a recording starts before the window
+    every later page is older still.
+    """
+    matches = []
+    done = False
+    for rec in recordings:
+        rec_start = rec.get("start_datetime", "")
+        if rec_start and rec_start < start:
+            done = True
+            continue
+        if rec_start and end and rec_start >= end:
+            continue
+        matches.append(_format_recording(rec))
+    return matches, done
+
+
+def list_grain_recordings(date: str = "") -> list[dict]:
+    """List recordings for a date (YYYY-MM-DD). Defaults to today."""
+    config = _get_config()
+    start, end = _day_window(date)
 
     all_recordings: list[dict] = []
     cursor = None
 
     while True:
-        payload: dict = {"include": {"participants": True}}
-        if cursor:
-            payload["cursor"] = cursor
-
-        resp = requests.post(
-            f"{config.base_url}/recordings",
+        resp = http.request(
+            "grain", "POST", f"{config.base_url}/recordings",
+            idempotent=True,
             headers=_headers(config),
-            json=payload,
+            json=_recordings_payload(start, end, cursor),
         )
         resp.raise_for_status()
         data = resp.json()
 
         recordings = data.get("recordings", [])
-        for rec in recordings:
-            rec_start = rec.get("start_datetime", "")
-            if rec_start and not (start <= rec_start < end):
-                continue
-            all_recordings.append({
-                "id": rec.get("id", ""),
-                "title": rec.get("title", ""),
-                "start_datetime": rec_start,
-                "end_datetime": rec.get("end_datetime", ""),
-                "duration": rec.get("duration", 0),
-                "participants": rec.get("participants", []),
-                "url": rec.get("url", ""),
-            })
+        matches, done = _page_in_window(recordings, start, end)
+        all_recordings.extend(matches)
 
         next_cursor = data.get("cursor")
-        if not next_cursor or not recordings:
+        if done or not next_cursor or not recordings:
             break
         cursor = next_cursor
 
     return all_recordings
 
 
+def _is_settled(recording: dict) -> bool:
+    """Whether a recording ended long enough ago for its transcript to be final.
+
+    A missing or unreadable end time (including one without a UTC offset)
+    counts as not settled.
+    """
+    try:
+        end = recording["end_datetime"]
+        ended = datetime.fromisoformat(end.replace("Z", "+00:00"))
+        return datetime.now(timezone.utc) - ended >= _TRANSCRIPT_SETTLE
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+
+
+def _get_recording(config: GrainConfig, recording_id: str) -> dict:
+    """Recording metadata, or {} if it cannot be fetched."""
+    try:
+        resp = http.request(
+            "grain", "GET", f"{config.base_url}/recordings/{recording_id}",
+            headers=_headers(config),
+        )
+        return resp.json() if resp.ok else {}
+    except (requests.RequestException, ValueError):
+        return {}
+
+
 def get_grain_transcript(recording_id: str) -> str:
-    """Full transcript (Speaker: line format)."""
+    """Full transcript (Speaker: line format).
+
+    Cached on disk once the recording has finished processing.
+    """
+    cached = transcript_cache.get(recording_id)
+    if cached is not None:
+        return cached
     config = _get_config()
-    resp = requests.get(
+    resp = http.request(
+        "grain", "GET",
         f"{config.base_url}/recordings/{recording_id}/transcript.txt",
         headers=_headers(config),
     )
     resp.raise_for_status()
+    if resp.text and _is_settled(_get_recording(config, recording_id)):
+        transcript_cache.put(recording_id, resp.text)
     return resp.text
+
+
+def slice_grain_transcript(
+    recording_id: str,
+    speaker: str = "",
+    start: str = "",
+    end: str = "",
+    last_minutes: int = 0,
+    keyword: str = "",
+    context: int = 2,
+    page: int = 1,
+    page_size: int = 50,
+) -> dict:
+    """Part of a transcript as turns, selected by speaker, time, keyword or page."""
+    text = get_grain_transcript(recording_id)
+    turns = transcripts.get_turns(recording_id, text)
+    result = transcripts.slice_turns(
+        turns,
+        speaker=speaker,
+        start=start,
+        end=end,
+        last_minutes=last_minutes,
+        keyword=keyword,
+        context=context,
+        page=page,
+        page_size=page_size,
+    )
+    return {"recording_id": recording_id, **result}
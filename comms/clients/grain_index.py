@@ -0,0 +1,230 @@
+"""Local Grain recordings index — SQLite copy of recording metadata.
+
+The index covers a contiguous span from ``covered_from`` up to the last
+refresh. Each refresh pages newest-first only down to the newest recording
+already stored (less a small overlap for recordings that finish processing
+late), or further back when a query asks for days before the covered span.
+Range and participant/title lookups are then answered locally.
+
+Stored recordings the API no longer returns within a refreshed span were
+deleted upstream and are dropped. Older rows are only paged over when a
+query reaches them, so at most every ``_RESCAN_INTERVAL`` a refresh also
+rescans the whole range being queried.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+
+from ..config import CacheConfig
+from . import http
+from .grain import (
+    _day_window,
+    _get_config,
+    _headers,
+    _page_in_window,
+    _recordings_payload,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recordings (
+    id TEXT PRIMARY KEY,
+    start_datetime TEXT NOT NULL,
+    title TEXT NOT NULL,
+    participants TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recordings_start ON recordings (start_datetime);
+"""
+
+# Recordings show up once processed, which can be after a later-starting
+# recording was already indexed; rescan this far below the newest one.
+_REFRESH_OVERLAP = timedelta(hours=6)
+# Lookups within this many seconds of a refresh reuse it.
+_REFRESH_INTERVAL = 60
+# How stale a deletion older than the refresh overlap may get.
+_RESCAN_INTERVAL = 3600
+
+_refresh_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    cache_dir = CacheConfig().cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_dir / "grain-recordings.sqlite3")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _state(conn: sqlite3.Connection) -> dict[str, str]:
+    return dict(conn.execute("SELECT key, value FROM state").fetchall())
+
+
+def _rescan_due(state: dict[str, str], since: str) -> bool:
+    """Whether stored rows from ``since`` on have not been rechecked lately."""
+    if time.time() - float(state.get("rescanned_at", 0)) >= _RESCAN_INTERVAL:
+        return True
+    return since < state.get("rescanned_from", since)
+
+
+def _refresh_bound(conn: sqlite3.Connection, since: str) -> str | None:
+    """Oldest start time a refresh must page down to, or None to skip it."""
+    state = _state(conn)
+    covered_from = state.get("covered_from")
+    if not covered_from or covered_from > since:
+        return since
+    if time.time() - float(state.get("refreshed_at", 0)) < _REFRESH_INTERVAL:
+        return None
+    # Everything from covered_from up to the newest indexed recording is
+    # stored, so a refresh only has to reach back to that recording, even
+    # when the query starts later: stopping at ``since`` would leave a gap
+    # that newest_start then skips over.
+    newest = datetime.fromisoformat(state["newest_start"][:19])
+    bound = (newest - _REFRESH_OVERLAP).isoformat() + "Z"
+    if _rescan_due(state, since):
+        return min(bound, since)
+    return bound
+
+
+def _apply_refresh(
+    conn: sqlite3.Connection, bound: str, recordings: list[dict]
+) -> None:
+    state = _state(conn)
+    newest = max(
+        [state.get("newest_start", bound)]
+        + [rec["start_datetime"] for rec in recordings if rec["start_datetime"]]
+    )
+    covered_from = min(state.get("covered_from", bound), bound)
+    # A refresh returns every recording from ``bound`` on.
+    fetched = {rec["id"] for rec in recordings}
+    deleted = [
+        (recording_id,)
+        for (recording_id,) in conn.execute(
+            "SELECT id FROM recordings WHERE start_datetime >= ?", (bound,)
+        )
+        if recording_id not in fetched
+    ]
+    refreshed = [
+        ("covered_from", covered_from),
+        ("newest_start", newest),
+        ("refreshed_at", str(time.time())),
+    ]
+    if _rescan_due(state, bound):
+        refreshed += [("rescanned_from", bound), ("rescanned_at", str(time.time()))]
+    with conn:
+        conn.executemany("DELETE FROM recordings WHERE id = ?", deleted)
+        conn.executemany(
+            "INSERT OR REPLACE INTO recordings "
+            "(id, start_datetime, title, participants, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    rec["id"],
+                    rec["start_datetime"],
+                    rec["title"],
+                    json.dumps(rec["participants"]),
+                    json.dumps(rec),
+                )
+                for rec in recordings
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", refreshed
+        )
+
+
+def _fetch_since(bound: str) -> list[dict]:
+    config = _get_config()
+    fetched: list[dict] = []
+    cursor = None
+    while True:
+        resp = http.request(
+            "grain", "POST", f"{config.base_url}/recordings",
+            idempotent=True,
+            headers=_headers(config),
+            json=_recordings_payload(bound, "", cursor),
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        recordings = data.get("recordings", [])
+        matches, done = _page_in_window(recordings, bound, "")
+        fetched.extend(matches)
+
+        cursor = data.get("cursor")
+        if done or not cursor or not recordings:
+            return fetched
+
+
+def _like_pattern(text: str) -> str:
+    """LIKE pattern matching ``text`` literally anywhere (ESCAPE '\\')."""
+    for char in "\\%_":
+        text = text.replace(char, "\\" + char)
+    return f"%{text}%"
+
+
+def _has_participant(recording: dict, participant: str) -> bool:
+    """Whether a participant's name or email contains ``participant``."""
+    needle = participant.casefold()
+    for person in recording.get("participants", []):
+        if isinstance(person, dict):
+            fields = [person.get("name"), person.get("email")]
+        else:
+            fields = [person]
+        if any(needle in str(field).casefold() for field in fields if field):
+            return True
+    return False
+
+
+def _query(
+    conn: sqlite3.Connection,
+    start: str,
+    end: str,
+    participant: str,
+    title: str,
+) -> list[dict]:
+    sql = "SELECT data FROM recordings WHERE start_datetime >= ? AND start_datetime < ?"
+    params = [start, end]
+    if title:
+        sql += " AND title LIKE ? ESCAPE '\\'"
+        params.append(_like_pattern(title))
+    sql += " ORDER BY start_datetime DESC"
+    recordings = [json.loads(row[0]) for row in conn.execute(sql, params)]
+    # Matched on the decoded names: the stored JSON also holds keys and
+    # quotes, and escapes non-ASCII characters.
+    if participant:
+        recordings = [r for r in recordings if _has_participant(r, participant)]
+    return recordings
+
+
+def _range_window(start_date: str, end_date: str) -> tuple[str, str]:
+    """ISO bounds covering start_date through end_date inclusive."""
+    start = _day_window(start_date)[0]
+    end = _day_window(end_date or start_date)[1]
+    return start, end
+
+
+def list_recordings(
+    start_date: str = "",
+    end_date: str = "",
+    participant: str = "",
+    title: str = "",
+) -> list[dict]:
+    """Recordings from start_date through end_date (YYYY-MM-DD), newest first.
+
+    Both dates default to today. ``participant`` and ``title`` are
+    case-insensitive substring filters.
+    """
+    start, end = _range_window(start_date, end_date)
+    with _refresh_lock, closing(_connect()) as conn:
+        bound = _refresh_bound(conn, start)
+        if bound is not None:
+            _apply_refresh(conn, bound, _fetch_since(bound))
+        return _query(conn, start, end, participant, title)
@@ -0,0 +1,143 @@
+"""Shared HTTP transport — one pooled, keep-alive session per upstream.
+
+Blocking callers use :func:`request` on a requests.Session; async callers
+use :func:`arequest` on an httpx.AsyncClient. Both apply the same timeouts,
+rate limits and retry policy.
+"""
+
+import asyncio
+import threading
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import HttpConfig
+from . import ratelimit, retry
+
+_sessions: dict[str, requests.Session] = {}
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def get_session(upstream: str) -> requests.Session:
+    """Return the shared session for an upstream, creating it on first use."""
+    with _lock:
+        session = _sessions.get(upstream)
+        if session is None:
+            config = HttpConfig()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=config.pool_size
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[upstream] = session
+        return session
+
+
+def get_async_client(upstream: str) -> httpx.AsyncClient:
+    """Return the shared async client for an upstream on the running loop.
+
+    Clients are kept per event loop, since an httpx client's connections
+    belong to the loop that opened them.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(upstream)
+        if client is None:
+            config = HttpConfig()
+            # requests follows redirects by default; httpx does not.
+            client = clients[upstream] = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=config.pool_size,
+                    max_keepalive_connections=config.pool_size,
+                ),
+                timeout=httpx.Timeout(
+                    config.read_timeout, connect=config.connect_timeout
+                ),
+            )
+        return client
+
+
+def _is_idempotent(method: str, idempotent: bool | None) -> bool:
+    if idempotent is None:
+        return method.upper() in _IDEMPOTENT_METHODS
+    return idempotent
+
+
+def request(
+    upstream: str,
+    method: str,
+    url: str,
+    idempotent: bool | None = None,
+    limit_method: str = "",
+    **kwargs,
+) -> requests.Response:
+    """Send a request on the upstream's session with default timeouts.
+
+    Waits on the upstream's rate limiter (``limit_method`` selects a method
+    tier) and retries through the shared retry policy. ``idempotent``
+    defaults to whether the HTTP method is; pass True for read-only POST
+    endpoints.
+    """
+    if "timeout" not in kwargs:
+        config = HttpConfig()
+        kwargs["timeout"] = (config.connect_timeout, config.read_timeout)
+    session = get_session(upstream)
+
+    def send() -> requests.Response:
+        ratelimit.acquire(upstream, limit_method)
+        resp = session.request(method, url, **kwargs)
+        if resp.status_code in retry.RETRYABLE_STATUSES:
+            resp.raise_for_status()
+        return resp
+
+    return retry.call(upstream, send, idempotent=_is_idempotent(method, idempotent))
+
+
+async def arequest(
+    upstream: str,
+    method: str,
+    url: str,
+    idempotent: bool | None = None,
+    limit_method: str = "",
+    **kwargs,
+) -> httpx.Response:
+    """Async counterpart of :func:`request` on the upstream's httpx client."""
+    client = get_async_client(upstream)
+
+    async def send() -> httpx.Response:
+        await ratelimit.acquire_async(upstream, limit_method)
+        resp = await client.request(method, url, **kwargs)
+        if resp.status_code in retry.RETRYABLE_STATUSES:
+            resp.raise_for_status()
+        return resp
+
+    return await retry.acall(
+        upstream, send, idempotent=_is_idempotent(method, idempotent)
+    )
+
+
+def close() -> None:
+    """Close every pooled blocking session."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+async def aclose() -> None:
+    """Close every async client created on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.aclose()
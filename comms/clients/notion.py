@@ -1,8 +1,21 @@
 """Notion API client — search pages, read page content."""
 
-import requests
+import time
 
 from ..config import NotionConfig
+from . import http, notion_cache
+
+# Default limits for walking a page's block tree.
+_MAX_DEPTH = 8
+_MAX_BLOCKS = 2000
+
+# Blocks that only group their children; rendered without a line or indent.
+_CONTAINER_TYPES = {"column_list", "column", "synced_block"}
+# Blocks whose children are a separate page and are not inlined.
+_PAGE_TYPES = {"child_page", "child_database"}
+# Child listings the integration cannot read, such as the original of a
+# synced block in a page it was not shared; the subtree is skipped.
+_UNREADABLE_STATUSES = {403, 404}
 
 
 def _get_config() -> NotionConfig:
@@ -30,10 +43,8 @@ def _get_title(page: dict) -> str:
     return ""
 
 
-def search_pages(query: str, max_results: int = 20) -> list[dict]:
-    """Search Notion pages and databases by query text."""
-    config = _get_config()
-    payload = {
+def _search_payload(query: str, max_results: int) -> dict:
+    return {
         "query": query,
         "page_size": min(max_results, 100),
         "sort": {
@@ -41,23 +52,42 @@ def search_pages(query: str, max_results: int = 20) -> list[dict]:
             "timestamp": "last_edited_time",
         },
     }
-    resp = requests.post(
-        f"{config.base_url}/search",
+
+
+def _format_search_result(item: dict) -> dict:
+    return {
+        "id": item.get("id", ""),
+        "type": item.get("object", ""),
+        "title": _get_title(item),
+        "url": item.get("url", ""),
+        "last_edited": item.get("last_edited_time", ""),
+    }
+
+
+def _format_page(page: dict, blocks_text: list[str], truncated: bool = False) -> dict:
+    return {
+        "id": page.get("id", ""),
+        "title": _get_title(page),
+        "url": page.get("url", ""),
+        "last_edited": page.get("last_edited_time", ""),
+        "content": "\n".join(blocks_text),
+        "truncated": truncated,
+    }
+
+
+def search_pages(query: str, max_results: int = 20) -> list[dict]:
+    """Search Notion pages and databases by query text."""
+    config = _get_config()
+    payload = _search_payload(query, max_results)
+    resp = http.request(
+        "notion", "POST", f"{config.base_url}/search",
+        idempotent=True,
         headers=_headers(config),
         json=payload,
     )
     resp.raise_for_status()
     results = resp.json().get("results", [])
-    pages = []
-    for item in results:
-        pages.append({
-            "id": item.get("id", ""),
-            "type": item.get("object", ""),
-            "title": _get_title(item),
-            "url": item.get("url", ""),
-            "last_edited": item.get("last_edited_time", ""),
-        })
-    return pages
+    return [_format_search_result(item) for item in results]
 
 
 def _extract_block_text(block: dict) -> str:
@@ -79,6 +109,11 @@ def _extract_block_text(block: dict) -> str:
         return f"  {marker} {text}"
     elif block_type == "code":
         return f"```\n{text}\n```"
+    elif block_type == "toggle":
+        return f"> {text}"
+    elif block_type in _PAGE_TYPES:
+        kind = "page" if block_type == "child_page" else "database"
+        return f"[{kind}] {type_data.get('title', '')}"
     elif block_type == "divider":
         return "---"
     elif text:
@@ -86,46 +121,159 @@ def _extract_block_text(block: dict) -> str:
     return ""
 
 
-def read_page(page_id: str) -> dict:
-    """Read full content of a Notion page. Returns blocks as plain text."""
-    config = _get_config()
+def _children_source(block: dict) -> str | None:
+    """Block ID to list this block's children from, or None to not descend.
 
-    # Get page metadata
-    page_resp = requests.get(
-        f"{config.base_url}/pages/{page_id}",
-        headers=_headers(config),
-    )
-    page_resp.raise_for_status()
-    page = page_resp.json()
+    A synced block that duplicates another reads its children from the
+    original.
+    """
+    if not block.get("has_children") or block.get("type") in _PAGE_TYPES:
+        return None
+    if block.get("type") == "synced_block":
+        original = (block.get("synced_block") or {}).get("synced_from") or {}
+        return original.get("block_id") or block.get("id")
+    return block.get("id")
+
+
+class _TreeWalk:
+    """Breadth-first walk state: children fetched per block, within limits."""
 
-    # Get page blocks (content)
-    blocks_text = []
+    def __init__(self, root_id: str, max_depth: int, max_blocks: int):
+        self.root_id = root_id
+        self.max_depth = max_depth
+        self.max_blocks = max_blocks
+        self.children: dict[str, list[dict]] = {}
+        self.count = 0
+        self.truncated = False
+        # Whether the render depends only on this page: content synced from
+        # elsewhere, or a subtree that could not be read, can change without
+        # moving the page's last_edited_time.
+        self.self_contained = True
+
+    def add_level(
+        self, fetched: list[tuple[str, list[dict] | None]], depth: int
+    ) -> list[str]:
+        """Record one level's children; return the block IDs to fetch next.
+
+        Children of None mark an unreadable block, whose subtree is skipped.
+        """
+        next_level: list[str] = []
+        for parent_id, blocks in fetched:
+            if blocks is None:
+                blocks = []
+                self.truncated = True
+                self.self_contained = False
+            room = self.max_blocks - self.count
+            if len(blocks) > room:
+                blocks = blocks[:room]
+                self.truncated = True
+            self.children[parent_id] = blocks
+            self.count += len(blocks)
+            sourced = [(block, _children_source(block)) for block in blocks]
+            sources = [src for _, src in sourced if src]
+            if depth + 1 < self.max_depth:
+                next_level.extend(sources)
+                if any(src and src != block.get("id") for block, src in sourced):
+                    self.self_contained = False
+            elif sources:
+                self.truncated = True
+        if self.count >= self.max_blocks and next_level:
+            self.truncated = True
+            return []
+        return [bid for bid in dict.fromkeys(next_level) if bid not in self.children]
+
+    def render(self) -> list[str]:
+        """Plain-text lines in document order, nested blocks indented."""
+        lines: list[str] = []
+        self._render(self.root_id, 0, lines)
+        return lines
+
+    def _render(self, parent_id: str, indent: int, lines: list[str]) -> None:
+        for block in self.children.get(parent_id, []):
+            nested = indent
+            if block.get("type") not in _CONTAINER_TYPES:
+                line = _extract_block_text(block)
+                if line:
+                    lines.append(_indent(line, indent))
+                nested = indent + 1
+            source = _children_source(block)
+            if source:
+                self._render(source, nested, lines)
+
+
+def _indent(text: str, level: int) -> str:
+    # Top-level list items already carry a two-space lead; nested blocks
+    # start two columns further in per level, under their parent's text.
+    if not level:
+        return text
+    prefix = "  " * (level + 1)
+    first, *rest = text.lstrip(" ").split("\n")
+    lines = [prefix + first] + [prefix + line if line else line for line in rest]
+    return "\n".join(lines)
+
+
+def _list_children(block_id: str) -> list[dict] | None:
+    """All children of a block, or None if the integration cannot read them."""
+    config = _get_config()
+    blocks: list[dict] = []
     cursor = None
     while True:
         params = {"page_size": 100}
         if cursor:
             params["start_cursor"] = cursor
-        blocks_resp = requests.get(
-            f"{config.base_url}/blocks/{page_id}/children",
+        resp = http.request(
+            "notion", "GET", f"{config.base_url}/blocks/{block_id}/children",
             headers=_headers(config),
             params=params,
         )
-        blocks_resp.raise_for_status()
-        data = blocks_resp.json()
-
-        for block in data.get("results", []):
-            line = _extract_block_text(block)
-            if line:
-                blocks_text.append(line)
-
+        if resp.status_code in _UNREADABLE_STATUSES:
+            return None
+        resp.raise_for_status()
+        data = resp.json()
+        blocks.extend(data.get("results", []))
         if not data.get("has_more"):
-            break
+            return blocks
         cursor = data.get("next_cursor")
 
-    return {
-        "id": page.get("id", ""),
-        "title": _get_title(page),
-        "url": page.get("url", ""),
-        "last_edited": page.get("last_edited_time", ""),
-        "content": "\n".join(blocks_text),
-    }
+
+def read_page(
+    page_id: str, max_depth: int = _MAX_DEPTH, max_blocks: int = _MAX_BLOCKS
+) -> dict:
+    """Read full content of a Notion page. Returns blocks as plain text.
+
+    Walks nested blocks (toggles, nested lists, columns, synced blocks)
+    breadth-first down to ``max_depth`` levels and ``max_blocks`` blocks;
+    ``truncated`` reports whether a limit, or a subtree the integration
+    cannot read, cut the tree short. Unchanged
+    pages are served from the local cache after a single page request.
+    """
+    config = _get_config()
+    started = time.time()
+
+    # Get page metadata
+    page_resp = http.request(
+        "notion", "GET", f"{config.base_url}/pages/{page_id}",
+        headers=_headers(config),
+    )
+    page_resp.raise_for_status()
+    page = page_resp.json()
+    cached = notion_cache.get(page, max_depth, max_blocks)
+    if cached is not None:
+        content, truncated = cached
+        return _format_page(page, [content], truncated)
+
+    # Get the block tree (content)
+    walk = _TreeWalk(page_id, max_depth, max_blocks)
+    level = [page_id]
+    depth = 0
+    while level:
+        fetched = [(block_id, _list_children(block_id)) for block_id in level]
+        level = walk.add_level(fetched, depth)
+        depth += 1
+
+    result = _format_page(page, walk.render(), walk.truncated)
+    if walk.self_contained:
+        notion_cache.put(
+            page, max_depth, max_blocks, result["content"], walk.truncated, started
+        )
+    return result
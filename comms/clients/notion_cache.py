@@ -0,0 +1,86 @@
+"""On-disk Notion page cache — rendered page content keyed by last_edited_time.
+
+A read first fetches the page object, which is one request, and reuses the
+rendered block tree when the page's ``last_edited_time`` has not moved.
+Notion reports that time to the minute, so a render taken within the same
+minute as the last edit is not trusted: a later edit in that minute would
+not change the timestamp. Renders that include content from other pages
+(synced blocks) are not stored, since edits there do not move this page's
+timestamp.
+"""
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+from ..config import CacheConfig
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    page_id TEXT NOT NULL,
+    max_depth INTEGER NOT NULL,
+    max_blocks INTEGER NOT NULL,
+    last_edited TEXT NOT NULL,
+    rendered_at REAL NOT NULL,
+    content TEXT NOT NULL,
+    truncated INTEGER NOT NULL,
+    PRIMARY KEY (page_id, max_depth, max_blocks)
+);
+"""
+
+# Granularity of Notion's last_edited_time.
+_EDIT_RESOLUTION = 60
+
+
+def _connect() -> sqlite3.Connection:
+    cache_dir = CacheConfig().cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_dir / "notion-pages.sqlite3")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _edited_at(last_edited: str) -> float:
+    return datetime.fromisoformat(last_edited.replace("Z", "+00:00")).timestamp()
+
+
+def get(page: dict, max_depth: int, max_blocks: int) -> tuple[str, bool] | None:
+    """Cached (content, truncated) for a page object, or None if stale."""
+    last_edited = page.get("last_edited_time", "")
+    if not last_edited:
+        return None
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT last_edited, rendered_at, content, truncated FROM pages "
+            "WHERE page_id = ? AND max_depth = ? AND max_blocks = ?",
+            (page.get("id", ""), max_depth, max_blocks),
+        ).fetchone()
+    if row is None or row[0] != last_edited:
+        return None
+    if row[1] < _edited_at(last_edited) + _EDIT_RESOLUTION:
+        return None
+    return row[2], bool(row[3])
+
+
+def put(
+    page: dict,
+    max_depth: int,
+    max_blocks: int,
+    content: str,
+    truncated: bool,
+    rendered_at: float,
+) -> None:
+    """Store a page's render; ``rendered_at`` is when the read began."""
+    last_edited = page.get("last_edited_time", "")
+    if not last_edited:
+        return
+    with closing(_connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO pages (page_id, max_depth, max_blocks, "
+            "last_edited, rendered_at, content, truncated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                page.get("id", ""), max_depth, max_blocks,
+                last_edited, rendered_at, content, int(truncated),
+            ),
+        )
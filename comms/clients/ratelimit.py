@@ -0,0 +1,123 @@
+"""Client-side token buckets per upstream and method tier.
+
+Concurrent tool calls wait here for capacity instead of collecting 429s
+from the upstream. Buckets and their limits come from RateLimitConfig;
+upstreams without a configured bucket are not limited.
+"""
+
+import asyncio
+import threading
+import time
+
+from .. import metrics
+from ..config import RateLimitConfig
+
+# Slack Web API rate-limit tier per method; unlisted methods count as tier 3.
+_SLACK_TIERS = {
+    "search.messages": "tier2",
+    "conversations.list": "tier2",
+    "users.list": "tier2",
+    "conversations.replies": "tier3",
+    "conversations.history": "tier3",
+    "users.info": "tier4",
+    "chat.postMessage": "post",
+}
+
+# Gmail per-user quota units per method; unlisted methods cost 5.
+_GMAIL_UNITS = {
+    "users.getProfile": 1,
+    "users.history.list": 2,
+    "users.messages.get": 5,
+    "users.messages.list": 5,
+    "users.messages.batchModify": 50,
+    "users.messages.send": 100,
+    "users.threads.get": 10,
+    "users.threads.list": 10,
+    "users.threads.modify": 10,
+    "users.drafts.create": 10,
+    "users.drafts.send": 100,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Requests larger than the burst run into debt."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, cost: float) -> float:
+        """Take ``cost`` tokens if available; otherwise return the wait needed."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            needed = min(cost, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= cost
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def acquire(self, cost: float = 1) -> float:
+        """Block until ``cost`` tokens are available. Returns seconds waited."""
+        waited = 0.0
+        while delay := self._take(cost):
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    async def acquire_async(self, cost: float = 1) -> float:
+        """Like :meth:`acquire`, but waits without blocking the event loop."""
+        waited = 0.0
+        while delay := self._take(cost):
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+
+_buckets: dict[str, TokenBucket | None] = {}
+_lock = threading.Lock()
+
+
+def _bucket(name: str) -> TokenBucket | None:
+    with _lock:
+        if name not in _buckets:
+            limit = RateLimitConfig().limits.get(name)
+            _buckets[name] = TokenBucket(*limit) if limit else None
+        return _buckets[name]
+
+
+def bucket_and_cost(upstream: str, method: str = "") -> tuple[str, float]:
+    """Map an upstream call to its bucket name and token cost."""
+    if upstream == "slack":
+        return f"slack.{_SLACK_TIERS.get(method, 'tier3')}", 1
+    if upstream == "gmail":
+        return "gmail", _GMAIL_UNITS.get(method, 5)
+    return upstream, 1
+
+
+def acquire(upstream: str, method: str = "", cost: float | None = None) -> None:
+    """Wait for capacity for one call (or ``cost`` tokens) to an upstream."""
+    name, default_cost = bucket_and_cost(upstream, method)
+    bucket = _bucket(name)
+    if bucket is None:
+        return
+    waited = bucket.acquire(default_cost if cost is None else cost)
+    if waited:
+        metrics.incr("rate_limit_wait_seconds", waited, bucket=name)
+
+
+async def acquire_async(upstream: str, method: str = "", cost: float | None = None) -> None:
+    """Async counterpart of :func:`acquire`."""
+    name, default_cost = bucket_and_cost(upstream, method)
+    bucket = _bucket(name)
+    if bucket is None:
+        return
+    waited = await bucket.acquire_async(default_cost if cost is None else cost)
+    if waited:
+        metrics.incr("rate_limit_wait_seconds", waited, bucket=name)
@@ -0,0 +1,234 @@
+"""Shared retry policy — exponential backoff with jitter, honoring Retry-After.
+
+Every upstream call goes through :func:`call` (or :func:`acall` for
+coroutines). Throttling (429, or a Google 403 with a rate-limit reason)
+is always retried because the upstream did not act on the request;
+server errors and connection failures are retried only for idempotent
+calls. Retries made
+while serving one tool call draw from a shared budget opened with
+:func:`budget`.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Iterator, TypeVar
+
+import httpx
+import requests
+
+from .. import metrics
+from ..config import RetryConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Google reports per-user and per-project quota exhaustion as 403s with
+# these error reasons rather than as 429.
+_GOOGLE_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+
+class _Budget:
+    def __init__(self, retries: int):
+        self.remaining = retries
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+_budget: ContextVar[_Budget | None] = ContextVar("retry_budget", default=None)
+
+
+@contextmanager
+def budget(retries: int | None = None) -> Iterator[None]:
+    """Cap the total retries made by everything run inside this block."""
+    if retries is None:
+        retries = RetryConfig().budget
+    token = _budget.set(_Budget(retries))
+    try:
+        yield
+    finally:
+        _budget.reset(token)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after_header(headers) -> str | None:
+    # requests and httpx headers are case-insensitive; SlackResponse.headers
+    # is a plain dict.
+    value = headers.get("Retry-After")
+    if value is not None:
+        return value
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            return value
+    return None
+
+
+def _google_reasons(exc: Exception) -> set[str]:
+    """Error reasons from a googleapiclient HttpError's JSON body."""
+    try:
+        error = json.loads(exc.content)["error"]
+    except (AttributeError, TypeError, ValueError, KeyError):
+        return set()
+    if not isinstance(error, dict):
+        return set()
+    entries = (error.get("errors") or []) + (error.get("details") or [])
+    return {e.get("reason", "") for e in entries if isinstance(e, dict)}
+
+
+def is_throttled(exc: Exception) -> bool:
+    """Whether the upstream throttled the call without acting on it."""
+    status = _classify(exc)[0]
+    if status == 429:
+        return True
+    return status == 403 and bool(_google_reasons(exc) & _GOOGLE_RATE_LIMIT_REASONS)
+
+
+def _classify(exc: Exception) -> tuple[int | None, float | None, bool]:
+    """Return (HTTP status, Retry-After seconds, transient network error)."""
+    # requests.HTTPError, httpx.HTTPStatusError and slack_sdk SlackApiError
+    # carry a response with status_code/headers; googleapiclient HttpError
+    # carries an httplib2 resp.
+    response = getattr(exc, "response", None)
+    if response is not None and hasattr(response, "status_code"):
+        headers = getattr(response, "headers", None) or {}
+        retry_after = _parse_retry_after(_retry_after_header(headers))
+        return response.status_code, retry_after, False
+    resp = getattr(exc, "resp", None)
+    if resp is not None and hasattr(resp, "status"):
+        return int(resp.status), _parse_retry_after(resp.get("retry-after")), False
+    transient = isinstance(
+        exc,
+        (
+            ConnectionError,
+            TimeoutError,
+            requests.ConnectionError,
+            requests.Timeout,
+            httpx.TransportError,
+        ),
+    )
+    return None, None, transient
+
+
+def backoff(attempt: int, config: RetryConfig | None = None) -> float:
+    """Full-jitter exponential delay before retry number ``attempt`` (1-based)."""
+    config = config or RetryConfig()
+    return random.uniform(0, min(config.max_delay, config.base_delay * 2 ** (attempt - 1)))
+
+
+def _plan(
+    upstream: str,
+    attempt: int,
+    reason: str,
+    retry_after: float | None,
+    config: RetryConfig,
+) -> float | None:
+    """Delay before retry number ``attempt``, or None if no retry is allowed.
+
+    The attempt limit, the tool-call budget, or an over-long Retry-After
+    each rule out another try.
+    """
+    if attempt >= config.max_attempts:
+        return None
+    if retry_after is not None and retry_after > config.max_delay:
+        return None
+    current = _budget.get()
+    if current is not None and not current.take():
+        metrics.incr("retry_budget_exhausted", upstream=upstream)
+        return None
+    delay = retry_after if retry_after is not None else backoff(attempt, config)
+    logger.warning(
+        "Retrying %s after %s (attempt %d/%d, sleeping %.2fs)",
+        upstream, reason, attempt + 1, config.max_attempts, delay,
+    )
+    metrics.incr("retries", upstream=upstream)
+    return delay
+
+
+def wait(
+    upstream: str,
+    attempt: int,
+    reason: str,
+    retry_after: float | None = None,
+    config: RetryConfig | None = None,
+) -> bool:
+    """Sleep before retry number ``attempt`` if the policy allows it."""
+    delay = _plan(upstream, attempt, reason, retry_after, config or RetryConfig())
+    if delay is None:
+        return False
+    time.sleep(delay)
+    return True
+
+
+def _plan_for(
+    upstream: str, attempt: int, exc: Exception, idempotent: bool, config: RetryConfig
+) -> float | None:
+    status, retry_after, transient = _classify(exc)
+    if is_throttled(exc):
+        retryable = True
+    elif status in RETRYABLE_STATUSES or transient:
+        retryable = idempotent
+    else:
+        retryable = False
+    if not retryable:
+        return None
+    reason = f"HTTP {status}" if status else type(exc).__name__
+    return _plan(upstream, attempt, reason, retry_after, config)
+
+
+def call(upstream: str, fn: Callable[[], T], idempotent: bool = True) -> T:
+    """Run ``fn``, retrying transient failures according to the policy."""
+    config = RetryConfig()
+    attempt = 1
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            delay = _plan_for(upstream, attempt, e, idempotent, config)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+async def acall(
+    upstream: str, fn: Callable[[], Awaitable[T]], idempotent: bool = True
+) -> T:
+    """Async counterpart of :func:`call` for coroutine-returning ``fn``."""
+    config = RetryConfig()
+    attempt = 1
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            delay = _plan_for(upstream, attempt, e, idempotent, config)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
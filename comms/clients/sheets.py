@@ -2,15 +2,12 @@
 
 from typing import Any
 
-from googleapiclient.discovery import build
-
-from ..config import GoogleConfig, SHEETS_SCOPES
+from ..config import SHEETS_SCOPES
+from .google import get_service
 
 
 def _get_service():
-    config = GoogleConfig()
-    creds = config.get_credentials(SHEETS_SCOPES)
-    return build("sheets", "v4", credentials=creds)
+    return get_service("sheets", "v4", SHEETS_SCOPES)
 
 
 def read_spreadsheet(spreadsheet_id: str, range: str) -> list[list[str]]:
@@ -4,9 +4,108 @@ Uses the user token (xoxp-) for everything so it acts as Mel and has access
 to all channels Mel is a member of.
 """
 
+import logging
+import re
+import threading
+import time
+from itertools import islice
+from urllib.parse import parse_qs, urlparse
+from typing import Any, Callable
+
 from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
 
 from ..config import SlackConfig
+from . import ratelimit, retry
+from .aio.locks import LoopLock
+
+logger = logging.getLogger(__name__)
+
+# Methods that change workspace state; everything else is safe to retry.
+_WRITE_METHODS = {"chat.postMessage"}
+
+_USER_DIRECTORY_TTL = 3600
+_CHANNEL_INDEX_TTL = 300
+# Cursor-paginated list methods accept a limit of at most 999.
+_LIST_PAGE_SIZE = 999
+_CHANNEL_TYPES = "public_channel,private_channel"
+_SEARCH_PAGE_SIZE = 100
+_THREAD_PAGE_SIZE = 200
+_MENTION = re.compile(r"<@([UW][A-Z0-9]+)(?:\|[^>]*)?>")
+
+
+class _Directory:
+    """Process-wide ID -> entry map, shared by sync and async callers.
+
+    Loaded once from a paginated listing; once older than ``ttl`` it keeps
+    serving the old map while a single background refresh replaces it.
+    ``name_of`` adds a name -> ID lookup over the entries.
+    """
+
+    def __init__(self, ttl: float, name_of: Callable[[Any], str] | None = None):
+        self.ttl = ttl
+        self.name_of = name_of
+        self.entries: dict[str, Any] = {}
+        self.ids_by_name: dict[str, str] = {}
+        self.loaded_at = 0.0
+        self.refreshing = False
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.async_load_lock = LoopLock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at > 0
+
+    def begin_refresh(self) -> bool:
+        """Claim the background refresh if the map is stale and none is running."""
+        with self.lock:
+            age = time.monotonic() - self.loaded_at
+            if self.refreshing or age < self.ttl:
+                return False
+            self.refreshing = True
+            return True
+
+    def replace(self, entries: dict[str, Any]) -> None:
+        ids_by_name = {}
+        if self.name_of:
+            # Keep named entries in name order so listings need no sort.
+            entries = dict(sorted(entries.items(), key=lambda kv: self.name_of(kv[1])))
+            ids_by_name = {self.name_of(e): k for k, e in entries.items()}
+        with self.lock:
+            self.entries = entries
+            self.ids_by_name = ids_by_name
+            self.loaded_at = time.monotonic()
+            self.refreshing = False
+
+    def refresh_failed(self) -> None:
+        with self.lock:
+            self.refreshing = False
+
+    def get(self, key: str) -> Any:
+        return self.entries.get(key)
+
+    def add(self, key: str, entry: Any) -> None:
+        with self.lock:
+            self.entries[key] = entry
+
+    def id_for(self, name: str) -> str | None:
+        return self.ids_by_name.get(name)
+
+
+_users = _Directory(_USER_DIRECTORY_TTL)
+_channels = _Directory(_CHANNEL_INDEX_TTL, name_of=lambda ch: ch.get("name", ""))
+
+
+class _RetryingWebClient(WebClient):
+    """WebClient whose API calls are rate limited and retried by shared policy."""
+
+    def api_call(self, api_method: str, **kwargs):
+        def send():
+            ratelimit.acquire("slack", api_method)
+            return super(_RetryingWebClient, self).api_call(api_method, **kwargs)
+
+        return retry.call("slack", send, idempotent=api_method not in _WRITE_METHODS)
 
 
 def _get_config() -> SlackConfig:
@@ -17,92 +116,340 @@ def _bot_client() -> WebClient:
     config = _get_config()
     if not config.bot_token:
         raise ValueError("Missing SLACK_BOT_TOKEN environment variable")
-    return WebClient(token=config.bot_token)
+    return _RetryingWebClient(token=config.bot_token, base_url=config.base_url)
 
 
 def _user_client() -> WebClient:
     config = _get_config()
     if not config.user_token:
         raise ValueError("Missing SLACK_USER_TOKEN environment variable")
-    return WebClient(token=config.user_token)
+    return _RetryingWebClient(token=config.user_token, base_url=config.base_url)
+
+
+def _resolve_mentions(text: str) -> str:
+    """Replace <@U123> mentions with @name where the user is known."""
+    names = _users.entries
+    return _MENTION.sub(lambda m: f"@{names[m[1]]}" if m[1] in names else m[0], text)
 
 
 def _resolve_user_name(client: WebClient, user_id: str) -> str:
     """Resolve a Slack user ID to a display name."""
     try:
         resp = client.users_info(user=user_id)
-        profile = resp["user"].get("profile", {})
-        return profile.get("real_name") or profile.get("display_name") or user_id
+        return _display_name(resp["user"], user_id)
     except Exception:
         return user_id
 
 
-def search_messages(query: str, max_results: int = 20) -> list[dict]:
-    """Search Slack messages across all public/joined channels."""
-    client = _user_client()
-    resp = client.search_messages(query=query, count=max_results)
-    matches = resp.get("messages", {}).get("matches", [])
-    results = []
+def _display_name(user: dict, user_id: str) -> str:
+    profile = user.get("profile", {})
+    return profile.get("real_name") or profile.get("display_name") or user_id
+
+
+def _user_entries(members: list[dict]) -> dict[str, str]:
+    return {m["id"]: _display_name(m, m["id"]) for m in members if m.get("id")}
+
+
+def _channel_entries(channels: list[dict]) -> dict[str, dict]:
+    return {ch["id"]: ch for ch in channels if ch.get("id")}
+
+
+def _list_all(method: Callable[..., Any], key: str, **kwargs) -> list[dict]:
+    """Every item of a cursor-paginated listing."""
+    items: list[dict] = []
+    cursor = ""
+    while True:
+        resp = method(limit=_LIST_PAGE_SIZE, cursor=cursor or None, **kwargs)
+        items.extend(resp.get(key, []))
+        cursor = resp.get("response_metadata", {}).get("next_cursor", "")
+        if not cursor:
+            return items
+
+
+def _load_users(client: WebClient) -> dict[str, str]:
+    return _user_entries(_list_all(client.users_list, "members"))
+
+
+def _load_channels(client: WebClient) -> dict[str, dict]:
+    return _channel_entries(_list_all(
+        client.conversations_list, "channels",
+        types=_CHANNEL_TYPES, exclude_archived=True,
+    ))
+
+
+def _refresh(directory: _Directory, load: Callable[[], dict]) -> None:
+    try:
+        directory.replace(load())
+    except Exception:
+        directory.refresh_failed()
+        logger.warning("Slack directory refresh failed", exc_info=True)
+
+
+def _ensure_loaded(directory: _Directory, load: Callable[[], dict]) -> None:
+    """Load a directory on first use; refresh it in the background when stale."""
+    if not directory.loaded:
+        with directory.load_lock:
+            if not directory.loaded:
+                directory.replace(load())
+    elif directory.begin_refresh():
+        threading.Thread(target=_refresh, args=(directory, load), daemon=True).start()
+
+
+def _ensure_users(client: WebClient) -> None:
+    _ensure_loaded(_users, lambda: _load_users(client))
+
+
+def _user_name(client: WebClient, user_id: str) -> str:
+    """Display name from the directory; users.info only for users it lacks."""
+    name = _users.get(user_id)
+    if name is None:
+        name = _resolve_user_name(client, user_id)
+        _users.add(user_id, name)
+    return name
+
+
+def _channel_id(client: WebClient, channel: str) -> str:
+    """Resolve "#name" through the channel index; other values pass through."""
+    if not channel.startswith("#"):
+        return channel
+    name = channel[1:]
+    _ensure_loaded(_channels, lambda: _load_channels(client))
+    channel_id = _channels.id_for(name)
+    if channel_id is None:
+        # Possibly created since the index was loaded.
+        _channels.replace(_load_channels(client))
+        channel_id = _channels.id_for(name)
+    # Unknown names go through as-is for Slack to resolve or reject.
+    return channel_id or channel
+
+
+def _select_channels(prefix: str, limit: int) -> list[dict]:
+    """Indexed channels in name order, optionally filtered by name prefix."""
+    prefix = prefix.lstrip("#").lower()
+    channels = _channels.entries.values()
+    if prefix:
+        channels = (ch for ch in channels if ch.get("name", "").startswith(prefix))
+    return [_format_channel(ch) for ch in islice(channels, limit)]
+
+
+def _format_match(msg: dict) -> dict:
+    return {
+        "channel": msg.get("channel", {}).get("name", ""),
+        "channel_id": msg.get("channel", {}).get("id", ""),
+        "user": _users.get(msg.get("user", "")) or msg.get("username", ""),
+        "text": _resolve_mentions(msg.get("text", "")),
+        "ts": msg.get("ts", ""),
+        "permalink": msg.get("permalink", ""),
+    }
+
+
+def _thread_ts(msg: dict) -> str:
+    """Root ts of a search match's thread; replies carry it in the permalink."""
+    if msg.get("thread_ts"):
+        return msg["thread_ts"]
+    query = parse_qs(urlparse(msg.get("permalink", "")).query)
+    return query.get("thread_ts", [msg.get("ts", "")])[0]
+
+
+def _group_matches(matches: list[dict]) -> list[dict]:
+    """Search matches grouped by channel, then thread, in ranking order."""
+    channels: dict[str, dict] = {}
     for msg in matches:
-        results.append({
-            "channel": msg.get("channel", {}).get("name", ""),
-            "channel_id": msg.get("channel", {}).get("id", ""),
-            "user": msg.get("username", ""),
-            "text": msg.get("text", ""),
-            "ts": msg.get("ts", ""),
-            "permalink": msg.get("permalink", ""),
+        channel = msg.get("channel", {})
+        group = channels.setdefault(channel.get("id", ""), {
+            "channel": channel.get("name", ""),
+            "channel_id": channel.get("id", ""),
+            "threads": {},
+        })
+        thread_ts = _thread_ts(msg)
+        thread = group["threads"].setdefault(thread_ts, {
+            "thread_ts": thread_ts,
+            "reply_count": None,
+            "matches": [],
         })
-    return results
+        match = _format_match(msg)
+        del match["channel"], match["channel_id"]
+        thread["matches"].append(match)
+    return [
+        {**group, "threads": list(group["threads"].values())}
+        for group in channels.values()
+    ]
+
+
+def _threads_to_expand(groups: list[dict], limit: int) -> list[tuple[str, dict]]:
+    """(channel ID, thread) pairs for the first ``limit`` threads."""
+    threads = [(g["channel_id"], t) for g in groups for t in g["threads"]]
+    return threads[:max(0, limit)]
+
+
+def _expand_thread(thread: dict, messages: list[dict], names: dict[str, str]) -> None:
+    """Attach reply count and replies from conversations.replies to a thread."""
+    root = messages[0] if messages else {}
+    thread["reply_count"] = root.get("reply_count", 0)
+    thread["replies"] = [
+        _format_reply(msg, names.get(msg.get("user", ""), "")) for msg in messages[1:]
+    ]
+
+
+def _format_search(query: str, total: int, matches: list[dict]) -> dict:
+    return {
+        "query": query,
+        "total": total,
+        "returned": len(matches),
+        "channels": _group_matches(matches),
+    }
+
+
+def _ts_key(ts: str) -> tuple[int, ...]:
+    # Slack timestamps are "seconds.micros"; compare without float rounding.
+    return tuple(int(part) for part in ts.split(".")) if ts else ()
+
+
+def _replies_params(
+    channel_id: str, thread_ts: str, since_ts: str, limit: int
+) -> dict:
+    params = {
+        "channel": channel_id,
+        "ts": thread_ts,
+        "limit": min(limit, _LIST_PAGE_SIZE) if limit > 0 else _LIST_PAGE_SIZE,
+    }
+    if since_ts:
+        params["oldest"] = since_ts
+    return params
+
+
+def _newer_than(messages: list[dict], since_ts: str) -> list[dict]:
+    # The thread root comes back even when it is older than ``oldest``.
+    if not since_ts:
+        return messages
+    since = _ts_key(since_ts)
+    return [m for m in messages if _ts_key(m.get("ts", "")) > since]
+
+
+def _thread_window(
+    messages: list[dict], limit: int, more_pages: bool, since_ts: str
+) -> tuple[list[dict], bool, str]:
+    """Messages capped at ``limit``, whether more exist, and the newest ts seen."""
+    has_more = more_pages or (limit > 0 and len(messages) > limit)
+    if limit > 0:
+        messages = messages[:limit]
+    latest_ts = messages[-1].get("ts", since_ts) if messages else since_ts
+    return messages, has_more, latest_ts
+
+
+def _format_reply(msg: dict, user_name: str) -> dict:
+    return {
+        "user": user_name,
+        "text": _resolve_mentions(msg.get("text", "")),
+        "ts": msg.get("ts", ""),
+    }
+
 
+def _format_channel(ch: dict) -> dict:
+    return {
+        "id": ch.get("id", ""),
+        "name": ch.get("name", ""),
+        "topic": _resolve_mentions(ch.get("topic", {}).get("value", "")),
+        "num_members": ch.get("num_members", 0),
+    }
+
+
+def _format_post(resp) -> dict:
+    return {
+        "ok": resp.get("ok", False),
+        "channel": resp.get("channel", ""),
+        "ts": resp.get("ts", ""),
+    }
+
+
+def search_messages(
+    query: str, max_results: int = 20, expand_threads: int = 5
+) -> dict:
+    """Search Slack messages across all public/joined channels.
 
-def read_thread(channel_id: str, thread_ts: str) -> list[dict]:
-    """Read a full Slack thread by channel ID and thread timestamp."""
+    Follows result pages up to ``max_results`` and groups matches by
+    channel and thread. The first ``expand_threads`` threads also get their
+    reply count and first page of replies.
+    """
     client = _user_client()
-    resp = client.conversations_replies(channel=channel_id, ts=thread_ts)
-    messages = resp.get("messages", [])
-    user_cache: dict[str, str] = {}
-    results = []
-    for msg in messages:
-        user_id = msg.get("user", "")
-        if user_id and user_id not in user_cache:
-            user_cache[user_id] = _resolve_user_name(client, user_id)
-        results.append({
-            "user": user_cache.get(user_id, user_id),
-            "text": msg.get("text", ""),
-            "ts": msg.get("ts", ""),
-        })
-    return results
+    _ensure_users(client)
+    page_size = min(_SEARCH_PAGE_SIZE, max(1, max_results))
+    matches: list[dict] = []
+    total = 0
+    page = 1
+    while len(matches) < max_results:
+        resp = client.search_messages(query=query, count=page_size, page=page)
+        messages = resp.get("messages", {})
+        matches.extend(messages.get("matches", []))
+        total = messages.get("total", len(matches))
+        pages = messages.get("paging", {}).get("pages", 1)
+        if not messages.get("matches") or page >= pages:
+            break
+        page += 1
+    result = _format_search(query, total, matches[:max_results])
+
+    for channel_id, thread in _threads_to_expand(result["channels"], expand_threads):
+        try:
+            resp = client.conversations_replies(
+                channel=channel_id, ts=thread["thread_ts"], limit=_THREAD_PAGE_SIZE
+            )
+        except SlackApiError:
+            continue
+        replies = resp.get("messages", [])
+        user_ids = {m["user"] for m in replies if m.get("user")}
+        _expand_thread(thread, replies, {u: _user_name(client, u) for u in user_ids})
+    return result
+
 
+def read_thread(
+    channel_id: str, thread_ts: str, since_ts: str = "", limit: int = 0
+) -> dict:
+    """Read a Slack thread by channel ID and thread timestamp.
 
-def list_channels(limit: int = 100) -> list[dict]:
-    """List available Slack channels."""
+    Follows every page of replies. ``since_ts`` returns only messages newer
+    than that timestamp, so a caller can poll for new replies by passing
+    the ``latest_ts`` from its previous read. ``limit`` caps the messages
+    returned (0 for no cap).
+    """
     client = _user_client()
-    resp = client.conversations_list(
-        types="public_channel,private_channel",
-        exclude_archived=True,
-        limit=limit,
+    _ensure_users(client)
+    params = _replies_params(channel_id, thread_ts, since_ts, limit)
+    messages: list[dict] = []
+    cursor = ""
+    while True:
+        resp = client.conversations_replies(**params, cursor=cursor or None)
+        messages.extend(_newer_than(resp.get("messages", []), since_ts))
+        cursor = resp.get("response_metadata", {}).get("next_cursor", "")
+        if not cursor or (limit > 0 and len(messages) >= limit):
+            break
+    messages, has_more, latest_ts = _thread_window(
+        messages, limit, bool(cursor), since_ts
     )
-    channels = resp.get("channels", [])
-    return [
-        {
-            "id": ch.get("id", ""),
-            "name": ch.get("name", ""),
-            "topic": ch.get("topic", {}).get("value", ""),
-            "num_members": ch.get("num_members", 0),
-        }
-        for ch in channels
-    ]
+    names = {
+        m["user"]: _user_name(client, m["user"]) for m in messages if m.get("user")
+    }
+    return {
+        "messages": [
+            _format_reply(msg, names.get(msg.get("user", ""), "")) for msg in messages
+        ],
+        "has_more": has_more,
+        "latest_ts": latest_ts,
+    }
+
+
+def list_channels(limit: int = 100, prefix: str = "") -> list[dict]:
+    """List available Slack channels by name, from the cached channel index."""
+    client = _user_client()
+    _ensure_users(client)
+    _ensure_loaded(_channels, lambda: _load_channels(client))
+    return _select_channels(prefix, limit)
 
 
 def send_message(channel: str, text: str, thread_ts: str = "") -> dict:
-    """Post a message to a Slack channel as Mel (user token)."""
+    """Post a message to a Slack channel (ID or #name) as Mel (user token)."""
     client = _user_client()
-    kwargs = {"channel": channel, "text": text}
+    kwargs = {"channel": _channel_id(client, channel), "text": text}
     if thread_ts:
         kwargs["thread_ts"] = thread_ts
     resp = client.chat_postMessage(**kwargs)
-    return {
-        "ok": resp.get("ok", False),
-        "channel": resp.get("channel", ""),
-        "ts": resp.get("ts", ""),
-    }
+    return _format_post(resp)
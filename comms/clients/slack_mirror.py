@@ -0,0 +1,292 @@
+"""Local Slack mirror — SQLite FTS5 copy of selected channels for instant search.
+
+Opt-in via COMMS_SLACK_MIRROR_CHANNELS. Each channel is synced
+incrementally with conversations.history, going back
+COMMS_SLACK_MIRROR_DAYS on the first sync. Later syncs start
+``_RECHECK_WINDOW`` before the newest mirrored timestamp. Edits in that
+window are applied, and stored messages in it that Slack no longer
+returns are deleted. Replies are mirrored for threads whose root falls
+inside a sync window; replies added later to older threads are not
+picked up.
+
+Searches answer from what is stored and never wait on Slack: a stale
+mirror is synced in the background, and results report ``syncing``
+while that runs.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+from ..config import CacheConfig, SlackConfig
+from . import retry
+from .slack import (
+    _channel_id,
+    _channels,
+    _ensure_users,
+    _format_search,
+    _list_all,
+    _resolve_mentions,
+    _ts_key,
+    _user_client,
+    _users,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    channel_id TEXT PRIMARY KEY,
+    channel_name TEXT NOT NULL,
+    latest_ts TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS messages (
+    rowid INTEGER PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    thread_ts TEXT NOT NULL,
+    user TEXT NOT NULL,
+    text TEXT NOT NULL,
+    search_text TEXT NOT NULL,
+    user_name TEXT NOT NULL,
+    UNIQUE (channel_id, ts)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    search_text, user_name, content='messages', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, search_text, user_name)
+    VALUES (new.rowid, new.search_text, new.user_name);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_au AFTER UPDATE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, search_text, user_name)
+    VALUES ('delete', old.rowid, old.search_text, old.user_name);
+    INSERT INTO messages_fts (rowid, search_text, user_name)
+    VALUES (new.rowid, new.search_text, new.user_name);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, search_text, user_name)
+    VALUES ('delete', old.rowid, old.search_text, old.user_name);
+END;
+"""
+
+logger = logging.getLogger(__name__)
+
+# Searches within this many seconds of a sync do not start another.
+_SYNC_INTERVAL = 60
+# Seconds before the newest mirrored message that each sync refetches, to
+# pick up edits, deletions and new replies.
+_RECHECK_WINDOW = 6 * 3600
+
+_sync_lock = threading.Lock()
+_state_lock = threading.Lock()
+_synced_at = 0.0
+_syncing = False
+
+
+def _begin_sync() -> bool:
+    """Claim the background sync if the mirror is stale and none is running."""
+    global _syncing
+    with _state_lock:
+        if _syncing or time.monotonic() - _synced_at < _SYNC_INTERVAL:
+            return False
+        _syncing = True
+        return True
+
+
+def _end_sync() -> None:
+    # A failed sync also waits out the interval before the next attempt.
+    global _syncing
+    with _state_lock:
+        _syncing = False
+    _mark_synced()
+
+
+def _mark_synced() -> None:
+    global _synced_at
+    _synced_at = time.monotonic()
+
+
+def _connect() -> sqlite3.Connection:
+    cache_dir = CacheConfig().cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_dir / "slack-mirror.sqlite3")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _sync_window(
+    conn: sqlite3.Connection, channel_id: str, days: int
+) -> tuple[str, str]:
+    """(oldest, latest): where a channel's sync starts and its newest stored ts."""
+    row = conn.execute(
+        "SELECT latest_ts FROM state WHERE channel_id = ?", (channel_id,)
+    ).fetchone()
+    if not row:
+        oldest = f"{time.time() - days * 86400:.6f}"
+        return oldest, oldest
+    seconds, _, micros = row[0].partition(".")
+    return f"{int(seconds) - _RECHECK_WINDOW}.{micros or '000000'}", row[0]
+
+
+def _thread_roots(messages: list[dict]) -> list[str]:
+    return [
+        m["ts"] for m in messages
+        if m.get("reply_count") and m.get("thread_ts", m["ts"]) == m["ts"]
+    ]
+
+
+def _channel_name(channel: str, channel_id: str) -> str:
+    if channel.startswith("#"):
+        return channel[1:]
+    return (_channels.get(channel_id) or {}).get("name", "")
+
+
+def _store(
+    conn: sqlite3.Connection,
+    channel_id: str,
+    channel_name: str,
+    history: list[dict],
+    replies: list[dict],
+    oldest: str,
+    latest: str,
+) -> None:
+    rows = []
+    for msg in history + replies:
+        user = msg.get("user", "")
+        text = msg.get("text", "")
+        rows.append((
+            channel_id,
+            msg["ts"],
+            msg.get("thread_ts", msg["ts"]),
+            user,
+            text,
+            _resolve_mentions(text),
+            _users.get(user) or msg.get("username", ""),
+        ))
+    latest = max([latest] + [m["ts"] for m in history], key=_ts_key)
+    # Every message of a thread rooted after ``oldest`` was just fetched, so
+    # stored ones missing from it were deleted. Slack timestamps are
+    # fixed-width, so they compare correctly as text.
+    fetched = {m["ts"] for m in history + replies}
+    deleted = [
+        (rowid,)
+        for rowid, ts in conn.execute(
+            "SELECT rowid, ts FROM messages WHERE channel_id = ? AND thread_ts > ?",
+            (channel_id, oldest),
+        )
+        if ts not in fetched
+    ]
+    with conn:
+        conn.executemany("DELETE FROM messages WHERE rowid = ?", deleted)
+        conn.executemany(
+            "INSERT INTO messages "
+            "(channel_id, ts, thread_ts, user, text, search_text, user_name) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (channel_id, ts) DO UPDATE SET "
+            "text = excluded.text, search_text = excluded.search_text, "
+            "user_name = excluded.user_name",
+            rows,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO state (channel_id, channel_name, latest_ts) "
+            "VALUES (?, ?, ?)",
+            (channel_id, channel_name, latest),
+        )
+
+
+def _mirror_config() -> SlackConfig:
+    config = SlackConfig()
+    if not config.mirror_channels:
+        raise ValueError("Set COMMS_SLACK_MIRROR_CHANNELS to enable the Slack mirror")
+    return config
+
+
+def _sync_channel(client, conn: sqlite3.Connection, channel: str, days: int) -> int:
+    channel_id = _channel_id(client, channel)
+    oldest, latest = _sync_window(conn, channel_id, days)
+    history = _list_all(
+        client.conversations_history, "messages", channel=channel_id, oldest=oldest
+    )
+    replies: list[dict] = []
+    for root_ts in _thread_roots(history):
+        thread = _list_all(
+            client.conversations_replies, "messages", channel=channel_id, ts=root_ts
+        )
+        replies.extend(m for m in thread if m.get("ts") != root_ts)
+    _store(
+        conn, channel_id, _channel_name(channel, channel_id),
+        history, replies, oldest, latest,
+    )
+    return len(history) + len(replies)
+
+
+def sync_mirror() -> dict:
+    """Pull new and recently changed messages for every mirrored channel."""
+    config = _mirror_config()
+    client = _user_client()
+    _ensure_users(client)
+    fetched: dict[str, int] = {}
+    with _sync_lock, closing(_connect()) as conn:
+        for channel in config.mirror_channels:
+            fetched[channel] = _sync_channel(client, conn, channel, config.mirror_days)
+        _mark_synced()
+    return {"fetched": fetched}
+
+
+def _background_sync() -> None:
+    try:
+        with retry.budget():
+            sync_mirror()
+    except Exception:
+        logger.warning("Slack mirror sync failed", exc_info=True)
+    finally:
+        _end_sync()
+
+
+def _fts_query(query: str) -> str:
+    # Quote every term so Slack-style input cannot hit FTS5 syntax.
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+def _search(conn: sqlite3.Connection, query: str, max_results: int) -> dict:
+    status = {"source": "mirror", "syncing": _syncing}
+    match = _fts_query(query)
+    if not match:
+        return {**_format_search(query, 0, []), **status}
+    total = conn.execute(
+        "SELECT COUNT(*) FROM messages_fts WHERE messages_fts MATCH ?", (match,)
+    ).fetchone()[0]
+    rows = conn.execute(
+        "SELECT m.channel_id, s.channel_name, m.ts, m.thread_ts, m.user, m.text "
+        "FROM messages_fts JOIN messages m ON m.rowid = messages_fts.rowid "
+        "LEFT JOIN state s ON s.channel_id = m.channel_id "
+        "WHERE messages_fts MATCH ? ORDER BY bm25(messages_fts) LIMIT ?",
+        (match, max_results),
+    ).fetchall()
+    matches = [
+        {
+            "channel": {"id": channel_id, "name": channel_name or ""},
+            "ts": ts,
+            "thread_ts": thread_ts,
+            "user": user,
+            "text": text,
+        }
+        for channel_id, channel_name, ts, thread_ts, user, text in rows
+    ]
+    return {**_format_search(query, total, matches), **status}
+
+
+def search_mirror(query: str, max_results: int = 20) -> dict:
+    """Search the mirrored channels locally; a stale mirror syncs in the background.
+
+    Returns the same channel/thread grouping as search_messages, without
+    thread expansion. ``syncing`` is true while a sync runs, so a first
+    search may come back empty.
+    """
+    _mirror_config()
+    if _begin_sync():
+        threading.Thread(target=_background_sync, daemon=True).start()
+    with closing(_connect()) as conn:
+        return _search(conn, query, max_results)
+
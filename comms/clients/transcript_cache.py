@@ -0,0 +1,65 @@
+"""On-disk Grain transcript cache — gzip files with LRU eviction by total size.
+
+Transcripts of finished recordings never change, so each is stored once
+under a hash of its recording ID. A file's mtime marks its last use; when
+the directory grows past the configured size the least recently used
+files are removed.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from ..config import CacheConfig
+
+_lock = threading.Lock()
+
+
+def _cache_dir(config: CacheConfig) -> Path:
+    return config.cache_dir / "grain-transcripts"
+
+
+def _path(config: CacheConfig, recording_id: str) -> Path:
+    digest = hashlib.sha256(recording_id.encode()).hexdigest()
+    return _cache_dir(config) / f"{digest}.txt.gz"
+
+
+def get(recording_id: str) -> str | None:
+    """Cached transcript for a recording, or None."""
+    path = _path(CacheConfig(), recording_id)
+    try:
+        data = path.read_bytes()
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return gzip.decompress(data).decode()
+
+
+def _evict(config: CacheConfig) -> None:
+    entries = []
+    for path in _cache_dir(config).glob("*.txt.gz"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= config.transcript_max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def put(recording_id: str, text: str) -> None:
+    """Store a transcript, evicting least recently used ones over the cap."""
+    config = CacheConfig()
+    path = _path(config, recording_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(gzip.compress(text.encode()))
+    os.replace(tmp, path)
+    with _lock:
+        _evict(config)
@@ -0,0 +1,184 @@
+"""Transcript parsing and slicing — turn a ``Speaker: line`` transcript into turns.
+
+A turn is one speaker's contiguous text with its character offset in the
+transcript and, when the transcript carries one, its start time in
+seconds. Timestamps are recognised as ``[HH:]MM:SS`` before the speaker
+(``00:01:23 Alice: ...``, ``[01:23] Alice: ...``) or after it
+(``Alice (01:23): ...``). Lines without a speaker prefix continue the
+previous turn. Parsed transcripts are kept in memory per recording.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+
+_TIME = r"(?:\d{1,2}:)?\d{1,2}:\d{2}"
+_TURN = re.compile(
+    rf"^\s*(?:\[?(?P<pre>{_TIME})\]?\s+)?"
+    rf"(?P<speaker>[^:\n\[\]()]{{1,80}}?)"
+    rf"(?:\s*[\[(](?P<post>{_TIME})[\])])?"
+    r":(?!//)\s?(?P<text>.*)$"
+)
+# "Alice (01:23)" alone on a line, with the turn's text on the lines below.
+_HEADER = re.compile(
+    rf"^\s*(?P<speaker>[^:\n\[\]()]{{1,80}}?)\s*[\[(](?P<post>{_TIME})[\])]\s*$"
+)
+
+_CACHE_SIZE = 32
+_parsed: OrderedDict[tuple[str, int, int], list[dict]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _seconds(stamp: str | None) -> int | None:
+    if not stamp:
+        return None
+    seconds = 0
+    for part in stamp.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def _clock(seconds: int | None) -> str:
+    if seconds is None:
+        return ""
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours:02d}:{rest // 60:02d}:{rest % 60:02d}"
+
+
+def _header_format(lines: list[str]) -> bool:
+    """Whether turns open with "Alice (01:23)" header lines.
+
+    Decided by the first line that looks like either kind of turn start.
+    """
+    for line in lines:
+        stripped = line.strip()
+        if _HEADER.match(stripped):
+            return True
+        if _TURN.match(stripped):
+            return False
+    return False
+
+
+def parse(text: str) -> list[dict]:
+    """Split a transcript into turns of {index, speaker, start, offset, text}.
+
+    In the header format only header lines open turns, so body lines that
+    happen to contain a colon stay part of the turn.
+    """
+    lines = text.splitlines(keepends=True)
+    turn_start = _HEADER if _header_format(lines) else _TURN
+    turns: list[dict] = []
+    offset = 0
+    for line in lines:
+        stripped = line.strip()
+        match = turn_start.match(stripped)
+        if match:
+            groups = match.groupdict()
+            turns.append({
+                "index": len(turns),
+                "speaker": match["speaker"].strip(),
+                "start": _seconds(groups.get("pre") or groups.get("post")),
+                "offset": offset,
+                "text": (groups.get("text") or "").strip(),
+            })
+        elif stripped and turns:
+            turns[-1]["text"] = f"{turns[-1]['text']} {stripped}".strip()
+        elif stripped:
+            turns.append({
+                "index": 0, "speaker": "", "start": None,
+                "offset": offset, "text": stripped,
+            })
+        offset += len(line)
+    return turns
+
+
+def get_turns(recording_id: str, text: str) -> list[dict]:
+    """Parsed turns for a recording, parsing each version of its transcript once.
+
+    Unsettled transcripts are refetched and can grow, so the text is part of
+    the key.
+    """
+    key = (recording_id, len(text), hash(text))
+    with _lock:
+        turns = _parsed.get(key)
+        if turns is not None:
+            _parsed.move_to_end(key)
+            return turns
+    turns = parse(text)
+    with _lock:
+        _parsed[key] = turns
+        while len(_parsed) > _CACHE_SIZE:
+            _parsed.popitem(last=False)
+    return turns
+
+
+def _keyword_window(turns: list[dict], keyword: str, context: int) -> list[dict]:
+    needle = keyword.lower()
+    keep: set[int] = set()
+    for i, turn in enumerate(turns):
+        if needle in turn["text"].lower():
+            keep.update(range(max(0, i - context), min(len(turns), i + context + 1)))
+    return [turns[i] for i in sorted(keep)]
+
+
+def slice_turns(
+    turns: list[dict],
+    speaker: str = "",
+    start: str = "",
+    end: str = "",
+    last_minutes: int = 0,
+    keyword: str = "",
+    context: int = 2,
+    page: int = 1,
+    page_size: int = 50,
+) -> dict:
+    """Select turns by speaker, time window and keyword, then paginate.
+
+    ``start``/``end`` are ``[HH:]MM:SS`` offsets into the recording;
+    ``last_minutes`` selects the tail of the recording instead. Keyword
+    matches include ``context`` turns either side. Filters combine.
+    """
+    times = [t["start"] for t in turns if t["start"] is not None]
+    duration = max(times) if times else None
+    selected = turns
+
+    low = _seconds(start) if start else None
+    high = _seconds(end) if end else None
+    if last_minutes and duration is not None:
+        low = max(0, duration - last_minutes * 60)
+        high = None
+    if low is not None or high is not None:
+        selected = [
+            t for t in selected
+            if t["start"] is not None
+            and (low is None or t["start"] >= low)
+            and (high is None or t["start"] < high)
+        ]
+    if speaker:
+        needle = speaker.lower()
+        selected = [t for t in selected if needle in t["speaker"].lower()]
+    if keyword:
+        selected = _keyword_window(selected, keyword, context)
+
+    page_size = max(1, page_size)
+    pages = max(1, -(-len(selected) // page_size))
+    page = min(max(1, page), pages)
+    chunk = selected[(page - 1) * page_size:page * page_size]
+    return {
+        "speakers": sorted({t["speaker"] for t in turns if t["speaker"]}),
+        "duration": _clock(duration),
+        "totalTurns": len(turns),
+        "matchedTurns": len(selected),
+        "page": page,
+        "pages": pages,
+        "turns": [
+            {
+                "index": t["index"],
+                "speaker": t["speaker"],
+                "time": _clock(t["start"]),
+                "offset": t["offset"],
+                "text": t["text"],
+            }
+            for t in chunk
+        ],
+    }
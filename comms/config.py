@@ -3,6 +3,7 @@
 import json
 import os
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from google.oauth2 import service_account
 
@@ -70,6 +71,18 @@ class SlackConfig:
     user_token: str = field(
         default_factory=lambda: os.environ.get("SLACK_USER_TOKEN", "")
     )
+    base_url: str = "https://slack.com/api/"
+    # Channel IDs or #names to mirror locally for search; empty disables it.
+    mirror_channels: list[str] = field(
+        default_factory=lambda: [
+            c.strip()
+            for c in os.environ.get("COMMS_SLACK_MIRROR_CHANNELS", "").split(",")
+            if c.strip()
+        ]
+    )
+    mirror_days: int = field(
+        default_factory=lambda: int(os.environ.get("COMMS_SLACK_MIRROR_DAYS", "30"))
+    )
 
 
 @dataclass
@@ -87,3 +100,118 @@ class AshbyConfig:
         default_factory=lambda: os.environ.get("ASHBY_API_KEY", "")
     )
     base_url: str = "https://api.ashbyhq.com"
+
+
+@dataclass
+class CacheConfig:
+    cache_dir: Path = field(
+        default_factory=lambda: Path(
+            os.environ.get("COMMS_CACHE_DIR", "~/.cache/comms")
+        ).expanduser()
+    )
+    transcript_max_bytes: int = field(
+        default_factory=lambda: int(
+            os.environ.get("COMMS_TRANSCRIPT_CACHE_BYTES", str(256 * 1024 * 1024))
+        )
+    )
+
+
+@dataclass
+class HttpConfig:
+    pool_size: int = field(
+        default_factory=lambda: int(os.environ.get("COMMS_HTTP_POOL_SIZE", "10"))
+    )
+    connect_timeout: float = field(
+        default_factory=lambda: float(os.environ.get("COMMS_HTTP_CONNECT_TIMEOUT", "5"))
+    )
+    read_timeout: float = field(
+        default_factory=lambda: float(os.environ.get("COMMS_HTTP_READ_TIMEOUT", "60"))
+    )
+
+
+@dataclass
+class RetryConfig:
+    max_attempts: int = field(
+        default_factory=lambda: int(os.environ.get("COMMS_RETRY_MAX_ATTEMPTS", "4"))
+    )
+    base_delay: float = field(
+        default_factory=lambda: float(os.environ.get("COMMS_RETRY_BASE_DELAY", "0.5"))
+    )
+    max_delay: float = field(
+        default_factory=lambda: float(os.environ.get("COMMS_RETRY_MAX_DELAY", "30"))
+    )
+    # Total retries allowed across all upstream calls made by one tool call.
+    budget: int = field(
+        default_factory=lambda: int(os.environ.get("COMMS_RETRY_BUDGET", "10"))
+    )
+
+
+# Client-side rate limits as bucket -> (tokens per second, burst capacity).
+# Slack buckets are per API tier, Gmail is measured in per-user quota units.
+DEFAULT_RATE_LIMITS: dict[str, tuple[float, float]] = {
+    "slack.tier1": (1 / 60, 1),
+    "slack.tier2": (20 / 60, 3),
+    "slack.tier3": (50 / 60, 5),
+    "slack.tier4": (100 / 60, 10),
+    "slack.post": (1, 1),
+    "notion": (3, 5),
+    "gmail": (250, 250),
+    "sheets": (1, 10),
+}
+
+
+def _parse_rate_limits(raw: str) -> dict[str, tuple[float, float]]:
+    """Parse "bucket=rate[/burst],..." overrides, e.g. "notion=2/4,grain=5"."""
+    limits = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, _, spec = item.partition("=")
+        rate, _, burst = spec.partition("/")
+        limits[name.strip()] = (float(rate), float(burst or max(1.0, float(rate))))
+    return limits
+
+
+@dataclass
+class RateLimitConfig:
+    limits: dict[str, tuple[float, float]] = field(
+        default_factory=lambda: {
+            **DEFAULT_RATE_LIMITS,
+            **_parse_rate_limits(os.environ.get("COMMS_RATE_LIMITS", "")),
+        }
+    )
+
+
+def _parse_sizes(raw: str) -> dict[str, int]:
+    """Parse "name=size,..." overrides, e.g. "grain=2,gmail=16"."""
+    sizes = {}
+    for item in raw.split(","):
+        if item.strip():
+            name, _, size = item.partition("=")
+            sizes[name.strip()] = int(size)
+    return sizes
+
+
+# Worker threads per upstream for blocking client calls. Slack, Notion, Grain
+# and Ashby are called natively async and do not use an executor.
+DEFAULT_EXECUTOR_WORKERS: dict[str, int] = {
+    "gmail": 8,
+    "calendar": 4,
+    "sheets": 4,
+    "drive": 4,
+}
+
+
+@dataclass
+class ExecutorConfig:
+    workers: dict[str, int] = field(
+        default_factory=lambda: {
+            **DEFAULT_EXECUTOR_WORKERS,
+            **_parse_sizes(os.environ.get("COMMS_EXECUTOR_WORKERS", "")),
+        }
+    )
+    default_workers: int = 4
+    # Calls allowed to wait for a worker before new callers are held back.
+    max_queue: int = field(
+        default_factory=lambda: int(os.environ.get("COMMS_EXECUTOR_MAX_QUEUE", "32"))
+    )
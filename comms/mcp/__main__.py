@@ -5,6 +5,7 @@ Run with: python -m comms.mcp
 """
 
 import asyncio
+import json
 import logging
 
 from dotenv import load_dotenv
@@ -12,6 +13,9 @@ from mcp.server.stdio import stdio_server
 
 load_dotenv()
 
+from .. import metrics
+from ..clients import http
+from . import executors
 from .server import create_server
 
 logging.basicConfig(
@@ -25,12 +29,17 @@ async def main():
     logger.info("Starting Comms MCP server...")
     server = create_server()
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        executors.shutdown()
+        await http.aclose()
+        logger.info("Client metrics: %s", json.dumps(metrics.snapshot()))
 
 
 if __name__ == "__main__":
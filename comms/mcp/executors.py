@@ -0,0 +1,87 @@
+"""Bounded thread pools per upstream for blocking client calls.
+
+Each upstream gets its own ThreadPoolExecutor, so a slow Grain download or
+Drive export cannot occupy the threads that Gmail calls need. Once an
+upstream has ``workers + max_queue`` calls in flight, further callers wait
+on the event loop before submitting (backpressure) rather than piling more
+work into the pool.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .. import metrics
+from ..config import ExecutorConfig
+
+
+class UpstreamExecutor:
+    def __init__(self, name: str, workers: int, max_queue: int):
+        self.name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"comms-{name}"
+        )
+        self._workers = workers
+        self._slots = asyncio.Semaphore(workers + max_queue)
+        self._in_flight = 0
+        self._waiting = 0
+
+    def _report(self) -> None:
+        metrics.gauge("executor_in_flight", self._in_flight, upstream=self.name)
+        metrics.gauge(
+            "executor_queue_depth",
+            max(0, self._in_flight - self._workers),
+            upstream=self.name,
+        )
+        metrics.gauge("executor_backpressure_waiting", self._waiting, upstream=self.name)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        self._waiting += 1
+        self._report()
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        self._report()
+        try:
+            # Carry context (e.g. the tool call's retry budget) into the worker.
+            ctx = contextvars.copy_context()
+            call = functools.partial(ctx.run, fn, *args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+            self._report()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_executors: dict[str, UpstreamExecutor] = {}
+
+
+def get_executor(upstream: str) -> UpstreamExecutor:
+    executor = _executors.get(upstream)
+    if executor is None:
+        config = ExecutorConfig()
+        executor = UpstreamExecutor(
+            upstream,
+            config.workers.get(upstream, config.default_workers),
+            config.max_queue,
+        )
+        _executors[upstream] = executor
+    return executor
+
+
+async def run(upstream: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking client call on the upstream's dedicated pool."""
+    return await get_executor(upstream).run(fn, *args, **kwargs)
+
+
+def shutdown() -> None:
+    for executor in _executors.values():
+        executor.shutdown()
+    _executors.clear()
@@ -1,11 +1,14 @@
 """Tool definitions and handlers for the Comms MCP server."""
 
-import asyncio
 import json
 import logging
 from typing import Any
 
-from ..clients import gmail, calendar, grain, sheets, ashby, slack, drive, notion
+from ..clients import gmail, gmail_sync, calendar, sheets, drive
+from ..clients.aio import ashby, grain, grain_index, notion, slack, slack_mirror
+from .. import metrics
+from ..clients import retry
+from . import executors
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,10 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
         "name": "search_emails",
         "description": (
             "Search Gmail with query syntax (from:, subject:, after:, is:inbox, etc.). "
-            "Returns id, threadId, subject, from, date, snippet for each result."
+            "Returns id, threadId, subject, from, date, snippet for each result. "
+            "Pages through results until max_results is reached. "
+            "Once sync_inbox has taken a local inbox snapshot, a bare "
+            "'is:inbox' query is served from it."
         ),
         "input_schema": {
             "type": "object",
@@ -37,11 +43,55 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
             "required": ["query"],
         },
     },
+    {
+        "name": "list_inbox_threads",
+        "description": (
+            "List inbox threads, one row per thread. Returns threadId, "
+            "latestMessageId, and the latest received message's sender, "
+            "subject, snippet and date, plus the thread's message count. "
+            "Drafts are not counted."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Gmail search query (default 'in:inbox')",
+                    "default": "in:inbox",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of threads (default 100)",
+                    "default": 100,
+                },
+            },
+            "required": [],
+        },
+    },
+    {
+        "name": "sync_inbox",
+        "description": (
+            "Sync the local inbox snapshot with Gmail using the History API. "
+            "Applies only changes since the last sync; falls back to a full "
+            "resync when the stored history ID has expired."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "full": {
+                    "type": "boolean",
+                    "description": "Force a full resync (default false)",
+                    "default": False,
+                },
+            },
+            "required": [],
+        },
+    },
     {
         "name": "read_email",
         "description": (
             "Read a specific email message by ID. "
-            "Returns full body, headers, and attachment names."
+            "Returns full body, headers, and attachment names and sizes."
         ),
         "input_schema": {
             "type": "object",
@@ -50,6 +100,11 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                     "type": "string",
                     "description": "The Gmail message ID",
                 },
+                "max_body_bytes": {
+                    "type": "integer",
+                    "description": "Cap on decoded body bytes per message (0 = no cap)",
+                    "default": 0,
+                },
             },
             "required": ["message_id"],
         },
@@ -58,7 +113,9 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
         "name": "read_thread",
         "description": (
             "Read an entire email thread by threadId. "
-            "Returns all messages chronologically with full body."
+            "Returns all messages chronologically with full body. "
+            "With dedupe_quotes, returns {messages, bytesSaved} where each body "
+            "holds only content new to that message."
         ),
         "input_schema": {
             "type": "object",
@@ -67,6 +124,16 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                     "type": "string",
                     "description": "The Gmail thread ID",
                 },
+                "max_body_bytes": {
+                    "type": "integer",
+                    "description": "Cap on decoded body bytes per message (0 = no cap)",
+                    "default": 0,
+                },
+                "dedupe_quotes": {
+                    "type": "boolean",
+                    "description": "Strip quoted history already shown earlier in the thread",
+                    "default": False,
+                },
             },
             "required": ["thread_id"],
         },
@@ -135,6 +202,24 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
             "required": ["message_id"],
         },
     },
+    {
+        "name": "archive_emails",
+        "description": (
+            "Archive many emails at once by removing their threads from the inbox. "
+            "Accepts message or thread IDs; reports status per ID."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "ids": {
+                    "type": "array",
+                    "description": "Gmail message or thread IDs to archive",
+                    "items": {"type": "string"},
+                },
+            },
+            "required": ["ids"],
+        },
+    },
     {
         "name": "send_email",
         "description": (
@@ -223,14 +308,34 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
         "name": "list_grain_recordings",
         "description": (
             "List Grain recordings for a date (default: today). "
-            "Returns title, date, duration, participants."
+            "Returns title, date, duration, participants. Set end_date, "
+            "participant or title to query a date range from the local "
+            "recordings index instead."
         ),
         "input_schema": {
             "type": "object",
             "properties": {
                 "date": {
                     "type": "string",
-                    "description": "Date in YYYY-MM-DD format (defaults to today)",
+                    "description": (
+                        "Date in YYYY-MM-DD format (defaults to today); "
+                        "the first day in range mode"
+                    ),
+                    "default": "",
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "Last day of the range, inclusive (YYYY-MM-DD)",
+                    "default": "",
+                },
+                "participant": {
+                    "type": "string",
+                    "description": "Only recordings with a matching participant name or email",
+                    "default": "",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Only recordings whose title contains this text",
                     "default": "",
                 },
             },
@@ -253,6 +358,64 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
             "required": ["recording_id"],
         },
     },
+    {
+        "name": "slice_grain_transcript",
+        "description": (
+            "Get part of a Grain transcript as speaker turns with timestamps. "
+            "Filter by speaker, time window or keyword and page through the "
+            "result instead of loading the whole transcript."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "recording_id": {
+                    "type": "string",
+                    "description": "The Grain recording ID",
+                },
+                "speaker": {
+                    "type": "string",
+                    "description": "Only turns by speakers whose name contains this text",
+                    "default": "",
+                },
+                "start": {
+                    "type": "string",
+                    "description": "Window start as [HH:]MM:SS into the recording",
+                    "default": "",
+                },
+                "end": {
+                    "type": "string",
+                    "description": "Window end as [HH:]MM:SS into the recording",
+                    "default": "",
+                },
+                "last_minutes": {
+                    "type": "integer",
+                    "description": "Only the last N minutes of the recording (overrides start/end)",
+                    "default": 0,
+                },
+                "keyword": {
+                    "type": "string",
+                    "description": "Only turns mentioning this text, with surrounding turns",
+                    "default": "",
+                },
+                "context": {
+                    "type": "integer",
+                    "description": "Turns to include either side of a keyword match",
+                    "default": 2,
+                },
+                "page": {
+                    "type": "integer",
+                    "description": "Page number, starting at 1",
+                    "default": 1,
+                },
+                "page_size": {
+                    "type": "integer",
+                    "description": "Turns per page",
+                    "default": 50,
+                },
+            },
+            "required": ["recording_id"],
+        },
+    },
     # --- Google Sheets ---
     {
         "name": "read_spreadsheet",
@@ -466,7 +629,8 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
         "name": "search_slack",
         "description": (
             "Search Slack messages across all public/joined channels by query. "
-            "Returns channel, sender, timestamp, message text, permalink."
+            "Returns matches grouped by channel and thread (sender, timestamp, "
+            "text, permalink); the top threads include reply count and replies."
         ),
         "input_schema": {
             "type": "object",
@@ -480,13 +644,36 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                     "description": "Maximum number of results (default 20)",
                     "default": 20,
                 },
+                "expand_threads": {
+                    "type": "integer",
+                    "description": (
+                        "How many matched threads to expand with their replies "
+                        "(default 5, 0 for none)"
+                    ),
+                    "default": 5,
+                },
+                "local": {
+                    "type": "boolean",
+                    "description": (
+                        "Search the local mirror of COMMS_SLACK_MIRROR_CHANNELS "
+                        "instead of the Slack API: instant, no rate limit, plain "
+                        "keywords only (no Slack search modifiers). A stale "
+                        "mirror syncs in the background; results say syncing "
+                        "while it runs and may lag Slack until it finishes"
+                    ),
+                    "default": False,
+                },
             },
             "required": ["query"],
         },
     },
     {
         "name": "read_slack_thread",
-        "description": "Read a full Slack thread by channel ID and thread timestamp.",
+        "description": (
+            "Read a Slack thread by channel ID and thread timestamp. Returns "
+            "messages, has_more and latest_ts; pass latest_ts back as since_ts "
+            "to fetch only replies posted since."
+        ),
         "input_schema": {
             "type": "object",
             "properties": {
@@ -498,13 +685,23 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                     "type": "string",
                     "description": "The thread parent message timestamp",
                 },
+                "since_ts": {
+                    "type": "string",
+                    "description": "Only messages newer than this timestamp",
+                    "default": "",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum messages to return (default 0, no cap)",
+                    "default": 0,
+                },
             },
             "required": ["channel_id", "thread_ts"],
         },
     },
     {
         "name": "list_slack_channels",
-        "description": "List available Slack channels.",
+        "description": "List available Slack channels, sorted by name.",
         "input_schema": {
             "type": "object",
             "properties": {
@@ -513,6 +710,11 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                     "description": "Maximum number of channels to return (default 100)",
                     "default": 100,
                 },
+                "prefix": {
+                    "type": "string",
+                    "description": "Only channels whose name starts with this",
+                    "default": "",
+                },
             },
             "required": [],
         },
@@ -528,7 +730,7 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
             "properties": {
                 "channel": {
                     "type": "string",
-                    "description": "Channel ID or name to post to",
+                    "description": "Channel ID or #channel-name to post to",
                 },
                 "text": {
                     "type": "string",
@@ -609,8 +811,9 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
     {
         "name": "read_notion_page",
         "description": (
-            "Read full content of a Notion page by page ID. "
-            "Returns blocks as plain text."
+            "Read full content of a Notion page by page ID, including nested "
+            "blocks (toggles, nested lists, columns, synced blocks). Returns "
+            "indented plain text and whether a depth/size limit cut it short."
         ),
         "input_schema": {
             "type": "object",
@@ -619,10 +822,34 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                     "type": "string",
                     "description": "The Notion page ID",
                 },
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Nesting levels to read (default 8)",
+                    "default": 8,
+                },
+                "max_blocks": {
+                    "type": "integer",
+                    "description": "Maximum blocks to read (default 2000)",
+                    "default": 2000,
+                },
             },
             "required": ["page_id"],
         },
     },
+    # --- Server ---
+    {
+        "name": "get_server_stats",
+        "description": (
+            "Report this server's client counters since it started: retries "
+            "and exhausted retry budgets per upstream, rate-limit wait time "
+            "per bucket, and executor in-flight and queued calls."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    },
 ]
 
 # ---------------------------------------------------------------------------
@@ -630,32 +857,66 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
 # ---------------------------------------------------------------------------
 
 
+_INBOX_QUERIES = {"is:inbox", "in:inbox"}
+
+
 async def handle_search_emails(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        gmail.search_emails,
-        query=arguments["query"],
-        max_results=arguments.get("max_results", 20),
+    query = arguments["query"]
+    max_results = arguments.get("max_results", 20)
+    results = None
+    if query.strip().lower() in _INBOX_QUERIES:
+        results = await executors.run(
+            "gmail", gmail_sync.search_inbox, max_results=max_results
+        )
+    if results is None:
+        results = await executors.run(
+            "gmail", gmail.search_emails, query=query, max_results=max_results
+        )
+    return json.dumps(results, indent=2)
+
+
+async def handle_list_inbox_threads(arguments: dict) -> str:
+    results = await executors.run(
+        "gmail", gmail.list_threads,
+        query=arguments.get("query", "in:inbox"),
+        max_results=arguments.get("max_results", 100),
     )
     return json.dumps(results, indent=2)
 
 
+async def handle_sync_inbox(arguments: dict) -> str:
+    result = await executors.run(
+        "gmail", gmail_sync.sync_inbox, full=arguments.get("full", False)
+    )
+    return json.dumps(result, indent=2)
+
+
 async def handle_read_email(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        gmail.read_email, message_id=arguments["message_id"]
+    result = await executors.run(
+        "gmail", gmail.read_email,
+        message_id=arguments["message_id"],
+        max_body_bytes=arguments.get("max_body_bytes") or None,
     )
     return json.dumps(result, indent=2)
 
 
 async def handle_read_thread(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        gmail.read_thread, thread_id=arguments["thread_id"]
+    dedupe_quotes = arguments.get("dedupe_quotes", False)
+    results = await executors.run(
+        "gmail", gmail.read_thread,
+        thread_id=arguments["thread_id"],
+        max_body_bytes=arguments.get("max_body_bytes") or None,
+        dedupe_quotes=dedupe_quotes,
     )
+    if dedupe_quotes:
+        saved = sum(r["bytesSaved"] for r in results)
+        return json.dumps({"messages": results, "bytesSaved": saved}, indent=2)
     return json.dumps(results, indent=2)
 
 
 async def handle_draft_email(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        gmail.draft_email,
+    result = await executors.run(
+        "gmail", gmail.draft_email,
         to=arguments["to"],
         subject=arguments["subject"],
         body=arguments["body"],
@@ -666,22 +927,27 @@ async def handle_draft_email(arguments: dict) -> str:
 
 
 async def handle_send_draft(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        gmail.send_draft, draft_id=arguments["draft_id"]
+    result = await executors.run(
+        "gmail", gmail.send_draft, draft_id=arguments["draft_id"]
     )
     return json.dumps(result, indent=2)
 
 
 async def handle_archive_email(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        gmail.archive_email, message_id=arguments["message_id"]
+    result = await executors.run(
+        "gmail", gmail.archive_email, message_id=arguments["message_id"]
     )
     return json.dumps(result, indent=2)
 
 
+async def handle_archive_emails(arguments: dict) -> str:
+    results = await executors.run("gmail", gmail.archive_emails, ids=arguments["ids"])
+    return json.dumps(results, indent=2)
+
+
 async def handle_send_email(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        gmail.send_email,
+    result = await executors.run(
+        "gmail", gmail.send_email,
         to=arguments["to"],
         subject=arguments["subject"],
         body=arguments["body"],
@@ -691,24 +957,24 @@ async def handle_send_email(arguments: dict) -> str:
 
 
 async def handle_list_calendar_events(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        calendar.list_calendar_events,
+    results = await executors.run(
+        "calendar", calendar.list_calendar_events,
         date=arguments.get("date", ""),
     )
     return json.dumps(results, indent=2)
 
 
 async def handle_get_calendar_event(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        calendar.get_calendar_event,
+    result = await executors.run(
+        "calendar", calendar.get_calendar_event,
         event_id=arguments["event_id"],
     )
     return json.dumps(result, indent=2)
 
 
 async def handle_update_calendar_event(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        calendar.update_calendar_event,
+    result = await executors.run(
+        "calendar", calendar.update_calendar_event,
         event_id=arguments["event_id"],
         description=arguments["description"],
     )
@@ -716,24 +982,48 @@ async def handle_update_calendar_event(arguments: dict) -> str:
 
 
 async def handle_list_grain_recordings(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        grain.list_grain_recordings,
-        date=arguments.get("date", ""),
-    )
+    end_date = arguments.get("end_date", "")
+    participant = arguments.get("participant", "")
+    title = arguments.get("title", "")
+    if end_date or participant or title:
+        results = await grain_index.list_recordings(
+            start_date=arguments.get("date", ""),
+            end_date=end_date,
+            participant=participant,
+            title=title,
+        )
+    else:
+        results = await grain.list_grain_recordings(
+            date=arguments.get("date", ""),
+        )
     return json.dumps(results, indent=2)
 
 
 async def handle_get_grain_transcript(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        grain.get_grain_transcript,
+    result = await grain.get_grain_transcript(
         recording_id=arguments["recording_id"],
     )
     return result  # Already a string (plain text transcript)
 
 
+async def handle_slice_grain_transcript(arguments: dict) -> str:
+    result = await grain.slice_grain_transcript(
+        recording_id=arguments["recording_id"],
+        speaker=arguments.get("speaker", ""),
+        start=arguments.get("start", ""),
+        end=arguments.get("end", ""),
+        last_minutes=arguments.get("last_minutes", 0),
+        keyword=arguments.get("keyword", ""),
+        context=arguments.get("context", 2),
+        page=arguments.get("page", 1),
+        page_size=arguments.get("page_size", 50),
+    )
+    return json.dumps(result, indent=2)
+
+
 async def handle_read_spreadsheet(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        sheets.read_spreadsheet,
+    result = await executors.run(
+        "sheets", sheets.read_spreadsheet,
         spreadsheet_id=arguments["spreadsheet_id"],
         range=arguments.get("range", "Sheet1!A:Z"),
     )
@@ -741,8 +1031,8 @@ async def handle_read_spreadsheet(arguments: dict) -> str:
 
 
 async def handle_append_rows(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        sheets.append_rows,
+    result = await executors.run(
+        "sheets", sheets.append_rows,
         spreadsheet_id=arguments["spreadsheet_id"],
         range=arguments.get("range", "Sheet1!A:Z"),
         rows=arguments["rows"],
@@ -751,8 +1041,8 @@ async def handle_append_rows(arguments: dict) -> str:
 
 
 async def handle_update_cells(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        sheets.update_cells,
+    result = await executors.run(
+        "sheets", sheets.update_cells,
         spreadsheet_id=arguments["spreadsheet_id"],
         range=arguments["range"],
         values=arguments["values"],
@@ -761,35 +1051,29 @@ async def handle_update_cells(arguments: dict) -> str:
 
 
 async def handle_search_ashby_candidates(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        ashby.search_candidates, name=arguments["name"]
-    )
+    results = await ashby.search_candidates(name=arguments["name"])
     return json.dumps(results, indent=2)
 
 
 async def handle_get_ashby_application(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        ashby.get_application, application_id=arguments["application_id"]
-    )
+    result = await ashby.get_application(application_id=arguments["application_id"])
     return json.dumps(result, indent=2)
 
 
 async def handle_list_ashby_interview_stages(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        ashby.list_interview_stages,
+    results = await ashby.list_interview_stages(
         interview_plan_id=arguments["interview_plan_id"],
     )
     return json.dumps(results, indent=2)
 
 
 async def handle_list_ashby_archive_reasons(arguments: dict) -> str:
-    results = await asyncio.to_thread(ashby.list_archive_reasons)
+    results = await ashby.list_archive_reasons()
     return json.dumps(results, indent=2)
 
 
 async def handle_submit_ashby_feedback(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        ashby.submit_feedback,
+    result = await ashby.submit_feedback(
         application_id=arguments["application_id"],
         summary=arguments["summary"],
         score=arguments["score"],
@@ -799,8 +1083,7 @@ async def handle_submit_ashby_feedback(arguments: dict) -> str:
 
 
 async def handle_progress_ashby_candidate(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        ashby.progress_candidate,
+    result = await ashby.progress_candidate(
         application_id=arguments["application_id"],
         interview_stage_id=arguments["interview_stage_id"],
     )
@@ -808,8 +1091,7 @@ async def handle_progress_ashby_candidate(arguments: dict) -> str:
 
 
 async def handle_reject_ashby_candidate(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        ashby.reject_candidate,
+    result = await ashby.reject_candidate(
         application_id=arguments["application_id"],
         archive_reason_id=arguments["archive_reason_id"],
         rejection_template_id=arguments.get(
@@ -823,34 +1105,40 @@ async def handle_reject_ashby_candidate(arguments: dict) -> str:
 
 
 async def handle_search_slack(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        slack.search_messages,
+    if arguments.get("local", False):
+        results = await slack_mirror.search_mirror(
+            query=arguments["query"],
+            max_results=arguments.get("max_results", 20),
+        )
+        return json.dumps(results, indent=2)
+    results = await slack.search_messages(
         query=arguments["query"],
         max_results=arguments.get("max_results", 20),
+        expand_threads=arguments.get("expand_threads", 5),
     )
     return json.dumps(results, indent=2)
 
 
 async def handle_read_slack_thread(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        slack.read_thread,
+    results = await slack.read_thread(
         channel_id=arguments["channel_id"],
         thread_ts=arguments["thread_ts"],
+        since_ts=arguments.get("since_ts", ""),
+        limit=arguments.get("limit", 0),
     )
     return json.dumps(results, indent=2)
 
 
 async def handle_list_slack_channels(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        slack.list_channels,
+    results = await slack.list_channels(
         limit=arguments.get("limit", 100),
+        prefix=arguments.get("prefix", ""),
     )
     return json.dumps(results, indent=2)
 
 
 async def handle_send_slack_message(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        slack.send_message,
+    result = await slack.send_message(
         channel=arguments["channel"],
         text=arguments["text"],
         thread_ts=arguments.get("thread_ts", ""),
@@ -862,8 +1150,8 @@ async def handle_send_slack_message(arguments: dict) -> str:
 
 
 async def handle_search_drive(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        drive.search_files,
+    results = await executors.run(
+        "drive", drive.search_files,
         query=arguments["query"],
         max_results=arguments.get("max_results", 20),
     )
@@ -871,8 +1159,8 @@ async def handle_search_drive(arguments: dict) -> str:
 
 
 async def handle_read_drive_file(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        drive.read_file, file_id=arguments["file_id"]
+    result = await executors.run(
+        "drive", drive.read_file, file_id=arguments["file_id"]
     )
     return json.dumps(result, indent=2)
 
@@ -881,8 +1169,7 @@ async def handle_read_drive_file(arguments: dict) -> str:
 
 
 async def handle_search_notion(arguments: dict) -> str:
-    results = await asyncio.to_thread(
-        notion.search_pages,
+    results = await notion.search_pages(
         query=arguments["query"],
         max_results=arguments.get("max_results", 20),
     )
@@ -890,29 +1177,42 @@ async def handle_search_notion(arguments: dict) -> str:
 
 
 async def handle_read_notion_page(arguments: dict) -> str:
-    result = await asyncio.to_thread(
-        notion.read_page, page_id=arguments["page_id"]
+    result = await notion.read_page(
+        page_id=arguments["page_id"],
+        max_depth=arguments.get("max_depth", 8),
+        max_blocks=arguments.get("max_blocks", 2000),
     )
     return json.dumps(result, indent=2)
 
 
+# --- Server handlers ---
+
+
+async def handle_get_server_stats(arguments: dict) -> str:
+    return json.dumps(metrics.snapshot(), indent=2)
+
+
 # ---------------------------------------------------------------------------
 # Dispatch
 # ---------------------------------------------------------------------------
 
 TOOL_HANDLERS = {
     "search_emails": handle_search_emails,
+    "list_inbox_threads": handle_list_inbox_threads,
+    "sync_inbox": handle_sync_inbox,
     "read_email": handle_read_email,
     "read_thread": handle_read_thread,
     "draft_email": handle_draft_email,
     "send_draft": handle_send_draft,
     "archive_email": handle_archive_email,
+    "archive_emails": handle_archive_emails,
     "send_email": handle_send_email,
     "list_calendar_events": handle_list_calendar_events,
     "get_calendar_event": handle_get_calendar_event,
     "update_calendar_event": handle_update_calendar_event,
     "list_grain_recordings": handle_list_grain_recordings,
     "get_grain_transcript": handle_get_grain_transcript,
+    "slice_grain_transcript": handle_slice_grain_transcript,
     "read_spreadsheet": handle_read_spreadsheet,
     "append_rows": handle_append_rows,
     "update_cells": handle_update_cells,
@@ -931,6 +1231,7 @@ TOOL_HANDLERS = {
     "read_drive_file": handle_read_drive_file,
     "search_notion": handle_search_notion,
     "read_notion_page": handle_read_notion_page,
+    "get_server_stats": handle_get_server_stats,
 }
 
 
@@ -939,7 +1240,8 @@ async def call_tool(name: str, arguments: dict) -> str:
     if not handler:
         return json.dumps({"error": f"Unknown tool: {name}"})
     try:
-        return await handler(arguments)
+        with retry.budget():
+            return await handler(arguments)
     except Exception as e:
         logger.exception(f"Error in tool {name}")
         return json.dumps({"error": str(e)})
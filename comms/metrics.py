@@ -0,0 +1,34 @@
+"""In-process counters and gauges for client and server instrumentation."""
+
+import threading
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, tuple], float] = {}
+_gauges: dict[tuple[str, tuple], float] = {}
+
+
+def _key(name: str, labels: dict[str, str]) -> tuple[str, tuple]:
+    return name, tuple(sorted(labels.items()))
+
+
+def incr(name: str, value: float = 1, **labels: str) -> None:
+    """Add to a counter."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def gauge(name: str, value: float, **labels: str) -> None:
+    """Set a gauge to its current value."""
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+def snapshot() -> dict[str, list[dict]]:
+    """All counters and gauges as {name: [{labels..., "value": v}, ...]}."""
+    result: dict[str, list[dict]] = {}
+    with _lock:
+        items = list(_counters.items()) + list(_gauges.items())
+    for (name, labels), value in items:
+        result.setdefault(name, []).append({**dict(labels), "value": value})
+    return result
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_env(monkeypatch, tmp_path):
+    """Keep caches in a temp dir and give every client a dummy token."""
+    monkeypatch.setenv("COMMS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("GRAIN_WORKSPACE_API_TOKEN", "test-token")
+    monkeypatch.setenv("NOTION_API_TOKEN", "test-token")
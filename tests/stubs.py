@@ -0,0 +1,94 @@
+"""Stand-ins for upstream HTTP APIs, installed in place of http.request."""
+
+import json
+
+import httpx
+import requests
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class PagedRecordings:
+    """Stub of Grain's POST /recordings: newest-first pages, counted.
+
+    With ``filtering`` the stub applies the request's after/before filter;
+    without it the filter is ignored, like an API that cannot filter.
+    """
+
+    def __init__(self, recordings, page_size=10, filtering=False):
+        self.recordings = recordings
+        self.page_size = page_size
+        self.filtering = filtering
+        self.pages = 0
+        self.payloads = []
+
+    def _matching(self, window):
+        recordings = sorted(
+            self.recordings, key=lambda r: r["start_datetime"], reverse=True
+        )
+        if not self.filtering:
+            return recordings
+        after = window.get("after_datetime", "")
+        before = window.get("before_datetime", "")
+        return [
+            r for r in recordings
+            if r["start_datetime"] >= after
+            and (not before or r["start_datetime"] < before)
+        ]
+
+    def __call__(self, upstream, method, url, **kwargs):
+        assert (upstream, method) == ("grain", "POST")
+        payload = kwargs["json"]
+        self.payloads.append(payload)
+        self.pages += 1
+        recordings = self._matching(payload.get("filter", {}))
+        offset = int(payload.get("cursor") or 0)
+        end = offset + self.page_size
+        return FakeResponse({
+            "recordings": recordings[offset:end],
+            "cursor": str(end) if end < len(recordings) else None,
+        })
+
+
+class NotionPages:
+    """Stub of Notion's page and block-children endpoints.
+
+    ``children`` maps block IDs to their child blocks; listing a block not
+    in it answers 404. Installs as http.request or (``.async_``) http.arequest.
+    """
+
+    def __init__(self, page, children):
+        self.page = page
+        self.children = children
+        self.requests = []
+
+    def _answer(self, url):
+        self.requests.append(url)
+        path = url.split("/v1/", 1)[-1]
+        if path.startswith("pages/"):
+            return 200, self.page
+        block_id = path.split("/")[1]
+        if block_id not in self.children:
+            return 404, {"object": "error", "status": 404}
+        return 200, {"results": self.children[block_id], "has_more": False}
+
+    def __call__(self, upstream, method, url, **kwargs):
+        status, payload = self._answer(url)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode()
+        response.url = url
+        return response
+
+    async def async_(self, upstream, method, url, **kwargs):
+        status, payload = self._answer(url)
+        return httpx.Response(status, json=payload, request=httpx.Request(method, url))
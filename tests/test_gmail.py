@@ -0,0 +1,40 @@
+from comms.clients import gmail
+
+
+def _dedupe(*bodies):
+    seen = set()
+    return [gmail._strip_quoted_history(body, seen) for body in bodies]
+
+
+def test_short_replies_from_different_senders_are_kept():
+    assert _dedupe("Thanks!\n\n-- \nJane", "Thanks!\n\n-- \nBob") == [
+        "Thanks!\n\n-- \nJane",
+        "Thanks!\n\n-- \nBob",
+    ]
+
+
+def test_quoted_history_is_dropped():
+    first = "Can we move the call to Friday?"
+    reply = (
+        "Friday works.\n\n"
+        "On Mon, Jan 6, 2025 at 9:14 AM Jane <jane@example.com> wrote:\n"
+        "> Can we move the call to Friday?\n"
+    )
+    outlook = (
+        "See you then.\n\n"
+        "-----Original Message-----\n"
+        "Friday works.\n\n"
+        "Something new in the quote.\n"
+    )
+
+    assert _dedupe(first, reply, outlook) == [
+        first,
+        "Friday works.",
+        "See you then.\n\nSomething new in the quote.",
+    ]
+
+
+def test_a_body_is_never_stripped_to_empty():
+    body = "On Mon, Jan 6, 2025 at 9:14 AM Jane <jane@example.com> wrote:\n> Hi"
+
+    assert _dedupe(body) == [body]
@@ -0,0 +1,21 @@
+import json
+import sqlite3
+from contextlib import closing
+
+from comms.clients import gmail_sync
+
+
+def test_stored_messages_lookup_stays_under_the_variable_limit():
+    with closing(gmail_sync._connect()) as conn:
+        conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        conn.executemany(
+            "INSERT INTO messages (id, thread_id, internal_date, data) "
+            "VALUES (?, ?, ?, ?)",
+            [(f"m{i}", "t", i, json.dumps({"id": f"m{i}"})) for i in range(2500)],
+        )
+        ids = [f"m{i}" for i in range(0, 5000, 2)]
+
+        stored = gmail_sync._stored_messages(conn, ids)
+
+    assert len(stored) == 1250
+    assert stored["m2498"] == {"id": "m2498"}
@@ -0,0 +1,157 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import requests
+
+from comms.clients import grain, http
+from comms.clients.aio import grain as aio_grain
+
+from stubs import FakeResponse, PagedRecordings
+
+
+def _hourly(newest: datetime, count: int) -> list[dict]:
+    return [
+        {
+            "id": f"r{i}",
+            "title": f"Meeting {i}",
+            "start_datetime": (newest - timedelta(hours=i)).isoformat() + "Z",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def api(monkeypatch):
+    # 500 hourly recordings ending at 23:00 on 2026-03-10.
+    stub = PagedRecordings(_hourly(datetime(2026, 3, 10, 23), 500))
+    monkeypatch.setattr(http, "request", stub)
+    return stub
+
+
+def test_stops_paging_once_recordings_predate_the_day(api):
+    recordings = grain.list_grain_recordings("2026-03-10")
+
+    assert [r["id"] for r in recordings] == [f"r{i}" for i in range(24)]
+    # The day fills pages 1-3; page 3 already reaches the day before.
+    assert api.pages == 3
+
+
+def test_sends_the_day_as_a_date_filter(api):
+    grain.list_grain_recordings("2026-03-10")
+
+    assert api.payloads[0]["filter"] == {
+        "after_datetime": "2026-03-10T00:00:00Z",
+        "before_datetime": "2026-03-11T00:00:00Z",
+    }
+
+
+def test_skips_newer_recordings_without_stopping(api):
+    recordings = grain.list_grain_recordings("2026-03-08")
+
+    assert len(recordings) == 24
+    assert recordings[0]["start_datetime"] == "2026-03-08T23:00:00Z"
+    assert api.pages == 8
+
+
+def test_page_in_window_flags_recordings_before_the_window():
+    start, end = "2026-03-10T00:00:00Z", "2026-03-11T00:00:00Z"
+    page = [
+        {"id": "late", "start_datetime": "2026-03-11T09:00:00Z"},
+        {"id": "in", "start_datetime": "2026-03-10T09:00:00Z"},
+        {"id": "early", "start_datetime": "2026-03-09T09:00:00Z"},
+    ]
+
+    matches, done = grain._page_in_window(page, start, end)
+
+    assert [m["id"] for m in matches] == ["in"]
+    assert done
+
+
+class TranscriptApi:
+    """Stub of the transcript and recording endpoints for one recording.
+
+    With ``error`` set, the recording endpoint raises it instead.
+    """
+
+    def __init__(self, end_datetime, error=None):
+        self.end_datetime = end_datetime
+        self.error = error
+        self.transcript_fetches = 0
+
+    def __call__(self, upstream, method, url, **kwargs):
+        if url.endswith("/transcript.txt"):
+            self.transcript_fetches += 1
+            return TextResponse("Alice: hello\n")
+        if self.error is not None:
+            raise self.error
+        return TextResponse("", {"id": "rec", "end_datetime": self.end_datetime})
+
+    async def async_(self, upstream, method, url, **kwargs):
+        resp = self(upstream, method, url, **kwargs)
+        resp.is_success = resp.ok
+        return resp
+
+
+class TextResponse(FakeResponse):
+    ok = True
+
+    def __init__(self, text, payload=None):
+        super().__init__(payload)
+        self.text = text
+
+
+def _ended(hours_ago: float) -> str:
+    ended = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return ended.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@pytest.mark.parametrize(
+    ("end_datetime", "fetches"),
+    [(_ended(24), 1), (_ended(0.5), 2), (None, 2)],
+    ids=["finished", "just-ended", "in-progress"],
+)
+def test_transcripts_are_cached_only_once_settled(monkeypatch, end_datetime, fetches):
+    api = TranscriptApi(end_datetime)
+    monkeypatch.setattr(http, "request", api)
+
+    assert grain.get_grain_transcript("rec") == "Alice: hello\n"
+    assert grain.get_grain_transcript("rec") == "Alice: hello\n"
+    assert api.transcript_fetches == fetches
+
+
+@pytest.mark.parametrize(
+    "end_datetime",
+    ["2020-01-01T10:00:00", "yesterday", 1700000000],
+    ids=["naive", "malformed", "not-a-string"],
+)
+def test_unreadable_end_times_are_not_settled(monkeypatch, end_datetime):
+    api = TranscriptApi(end_datetime)
+    monkeypatch.setattr(http, "request", api)
+
+    grain.get_grain_transcript("rec")
+    grain.get_grain_transcript("rec")
+
+    assert api.transcript_fetches == 2
+
+
+def test_failed_metadata_fetch_still_returns_the_transcript(monkeypatch):
+    api = TranscriptApi(_ended(24), error=requests.ConnectionError("reset"))
+    monkeypatch.setattr(http, "request", api)
+
+    assert grain.get_grain_transcript("rec") == "Alice: hello\n"
+    assert grain.get_grain_transcript("rec") == "Alice: hello\n"
+    assert api.transcript_fetches == 2
+
+
+def test_failed_metadata_fetch_still_returns_the_transcript_async(monkeypatch):
+    request = httpx.Request("GET", "https://grain.test/recordings/rec")
+    error = httpx.HTTPStatusError(
+        "throttled", request=request, response=httpx.Response(429, request=request)
+    )
+    api = TranscriptApi(_ended(24), error=error)
+    monkeypatch.setattr(http, "arequest", api.async_)
+
+    assert asyncio.run(aio_grain.get_grain_transcript("rec")) == "Alice: hello\n"
+    assert api.transcript_fetches == 1
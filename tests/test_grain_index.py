@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+
+import pytest
+
+from comms.clients import grain_index, http
+
+from stubs import PagedRecordings
+
+
+def _day(offset: int) -> str:
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+def _recording(recording_id: str, day_offset: int) -> dict:
+    return {
+        "id": recording_id,
+        "title": f"Meeting {recording_id}",
+        "start_datetime": f"{_day(day_offset)}T10:00:00Z",
+        "participants": [],
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    stub = PagedRecordings([_recording("r1", -3)], filtering=True)
+    monkeypatch.setattr(http, "request", stub)
+    return stub
+
+
+def _ids(recordings):
+    return [r["id"] for r in recordings]
+
+
+def test_refresh_reaches_back_to_the_newest_indexed_recording(api, monkeypatch):
+    assert _ids(grain_index.list_recordings(_day(-3), _day(0))) == ["r1"]
+
+    api.recordings += [_recording("r2", -2), _recording("r3", 0)]
+    monkeypatch.setattr(grain_index, "_REFRESH_INTERVAL", -1)
+
+    assert _ids(grain_index.list_recordings()) == ["r3"]
+    assert _ids(grain_index.list_recordings(_day(-2))) == ["r2"]
+    assert _ids(grain_index.list_recordings(_day(-3), _day(0))) == ["r3", "r2", "r1"]
+
+
+def test_lookups_within_the_refresh_interval_stay_local(api):
+    grain_index.list_recordings(_day(-3), _day(0))
+    pages = api.pages
+
+    grain_index.list_recordings(_day(-1))
+
+    assert api.pages == pages
+
+
+def test_days_before_the_covered_span_are_fetched(api):
+    grain_index.list_recordings(_day(-1))
+    api.recordings.append(_recording("r0", -5))
+
+    assert _ids(grain_index.list_recordings(_day(-5), _day(-3))) == ["r1", "r0"]
+
+
+def test_filters_match_text_literally(api):
+    api.recordings[0]["title"] = "Q3_review"
+    api.recordings[0]["participants"] = [{"name": "José Ruiz", "email": "jr@x.io"}]
+    api.recordings.append(_recording("r2", -3) | {"title": "Q3 review"})
+
+    assert _ids(grain_index.list_recordings(_day(-3), title="q3_")) == ["r1"]
+    assert _ids(grain_index.list_recordings(_day(-3), title="%")) == []
+    assert _ids(grain_index.list_recordings(_day(-3), participant="josé")) == ["r1"]
+    assert _ids(grain_index.list_recordings(_day(-3), participant="name")) == []
+
+
+def test_recordings_deleted_upstream_are_dropped(api, monkeypatch):
+    api.recordings.append(_recording("r2", 0))
+    assert _ids(grain_index.list_recordings(_day(-3), _day(0))) == ["r2", "r1"]
+    monkeypatch.setattr(grain_index, "_REFRESH_INTERVAL", -1)
+
+    api.recordings.pop()
+    assert _ids(grain_index.list_recordings(_day(-3), _day(0))) == ["r1"]
+
+    api.recordings.clear()
+    assert _ids(grain_index.list_recordings(_day(-3), _day(0))) == ["r1"]
+    monkeypatch.setattr(grain_index, "_RESCAN_INTERVAL", -1)
+    assert _ids(grain_index.list_recordings(_day(-3), _day(0))) == []
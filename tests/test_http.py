@@ -0,0 +1,31 @@
+import asyncio
+
+from comms.clients import http
+from comms.clients.aio.locks import LoopLock
+
+
+async def _client_pair():
+    first = http.get_async_client("test")
+    second = http.get_async_client("test")
+    await http.aclose()
+    return first, second
+
+
+def test_async_clients_are_kept_per_event_loop():
+    first, again = asyncio.run(_client_pair())
+    other, _ = asyncio.run(_client_pair())
+
+    assert first is again
+    assert other is not first
+    assert first.is_closed and other.is_closed
+
+
+def test_loop_lock_works_across_event_loops():
+    lock = LoopLock()
+
+    async def use():
+        async with lock.get():
+            await asyncio.sleep(0)
+        return lock.get()
+
+    assert asyncio.run(use()) is not asyncio.run(use())
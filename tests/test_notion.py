@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from comms.clients import http, notion
+from comms.clients.aio import notion as aio_notion
+
+from stubs import NotionPages
+
+
+def _text(block_id, block_type, text, has_children=False):
+    return {
+        "id": block_id,
+        "type": block_type,
+        block_type: {"rich_text": [{"plain_text": text}]},
+        "has_children": has_children,
+    }
+
+
+PAGE = {
+    "id": "page",
+    "url": "https://notion.test/page",
+    "last_edited_time": "2020-01-01T00:00:00.000Z",
+    "properties": {"title": {"type": "title", "title": [{"plain_text": "Spec"}]}},
+}
+
+
+def _tree():
+    return {
+        "page": [
+            _text("intro", "paragraph", "Intro"),
+            _text("toggle", "toggle", "Details", has_children=True),
+            {
+                "id": "copy",
+                "type": "synced_block",
+                "synced_block": {"synced_from": {"block_id": "elsewhere"}},
+                "has_children": True,
+            },
+            _text("outro", "paragraph", "Outro"),
+        ],
+        "toggle": [_text("hidden", "bulleted_list_item", "Hidden item")],
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    stub = NotionPages(PAGE, _tree())
+    monkeypatch.setattr(http, "request", stub)
+    monkeypatch.setattr(http, "arequest", stub.async_)
+    return stub
+
+
+@pytest.mark.parametrize("client", ["sync", "async"])
+def test_unreadable_synced_original_is_skipped(api, client):
+    if client == "sync":
+        page = notion.read_page("page")
+    else:
+        page = asyncio.run(aio_notion.read_page("page"))
+
+    assert page["content"].splitlines() == [
+        "Intro", "> Details", "    - Hidden item", "Outro",
+    ]
+    assert page["truncated"]
+
+
+def _read_twice(api):
+    notion.read_page("page")
+    before = len(api.requests)
+    notion.read_page("page")
+    return len(api.requests) - before
+
+
+def test_unchanged_page_is_served_from_the_cache(api):
+    api.children["page"] = [
+        block for block in api.children["page"] if block["type"] != "synced_block"
+    ]
+
+    assert _read_twice(api) == 1
+
+
+def test_pages_with_synced_content_are_not_cached(api):
+    api.children["elsewhere"] = [_text("shared", "paragraph", "Shared")]
+
+    assert _read_twice(api) == 4
+    assert "Shared" in notion.read_page("page")["content"]
@@ -0,0 +1,86 @@
+import json
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.slack_response import SlackResponse
+
+from comms.clients import gmail, retry
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setenv("COMMS_RETRY_BASE_DELAY", "0")
+
+
+def _google_error(status, reason=""):
+    resp = httplib2.Response({"status": status})
+    body = {"error": {"code": status, "message": "x", "errors": [{"reason": reason}]}}
+    return HttpError(resp, json.dumps(body).encode())
+
+
+def test_google_rate_limit_403s_are_throttling():
+    assert retry.is_throttled(_google_error(403, "userRateLimitExceeded"))
+    assert retry.is_throttled(_google_error(403, "rateLimitExceeded"))
+    assert not retry.is_throttled(_google_error(403, "insufficientPermissions"))
+
+
+def test_rate_limited_403_is_retried_even_when_not_idempotent():
+    errors = [_google_error(403, "userRateLimitExceeded")]
+
+    def send():
+        if errors:
+            raise errors.pop()
+        return "sent"
+
+    assert retry.call("gmail", send, idempotent=False) == "sent"
+
+
+def test_slack_retry_after_is_read_case_insensitively():
+    response = SlackResponse(
+        client=None, http_verb="POST", api_url="https://slack.test/api",
+        req_args={}, data={"ok": False}, headers={"retry-after": "30"},
+        status_code=429,
+    )
+
+    assert retry._classify(SlackApiError("throttled", response)) == (429, 30.0, False)
+
+
+class FlakyBatchService:
+    """Gmail service whose first batch call fails as a whole with a 503."""
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def new_batch_http_request(self, callback):
+        service = self
+
+        class Batch:
+            def __init__(self):
+                self.ids = []
+
+            def add(self, request, request_id):
+                self.ids.append(request_id)
+
+            def execute(self):
+                service.batch_calls += 1
+                if service.batch_calls == 1:
+                    raise _google_error(503)
+                for request_id in self.ids:
+                    callback(request_id, {"id": request_id}, None)
+
+        return Batch()
+
+
+class FakeRequest:
+    methodId = "gmail.users.messages.get"
+
+
+def test_a_failed_batch_call_is_retried():
+    service = FlakyBatchService()
+
+    results = gmail._batch_execute(service, [FakeRequest] * 3)
+
+    assert results == [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+    assert service.batch_calls == 2
@@ -0,0 +1,58 @@
+import asyncio
+
+import httpx
+import pytest
+
+from comms.clients import http
+from comms.clients.aio import slack
+
+
+class SlackApi:
+    """Stub of the Slack Web API over http.arequest; replies are throttled."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, upstream, method, url, **kwargs):
+        api_method = url.rsplit("/", 1)[-1]
+        self.calls.append(api_method)
+        request = httpx.Request(method, url)
+        if api_method == "conversations.replies":
+            response = httpx.Response(429, request=request)
+            raise httpx.HTTPStatusError("throttled", request=request, response=response)
+        payloads = {
+            "users.list": {"ok": True, "members": []},
+            "search.messages": {
+                "ok": True,
+                "messages": {
+                    "total": 1,
+                    "paging": {"pages": 1},
+                    "matches": [{
+                        "channel": {"id": "C1", "name": "general"},
+                        "ts": "100.000100",
+                        "permalink": "https://slack.test/p?thread_ts=100.000100",
+                        "user": "U1",
+                        "text": "hello",
+                    }],
+                },
+            },
+        }
+        return httpx.Response(200, json=payloads[api_method], request=request)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setenv("SLACK_USER_TOKEN", "xoxp-test")
+    stub = SlackApi()
+    monkeypatch.setattr(http, "arequest", stub)
+    monkeypatch.setattr(slack._users, "loaded_at", 0.0)
+    return stub
+
+
+def test_throttled_thread_expansion_does_not_fail_the_search(api):
+    result = asyncio.run(slack.search_messages("hello"))
+
+    assert "conversations.replies" in api.calls
+    assert result["returned"] == 1
+    thread = result["channels"][0]["threads"][0]
+    assert thread.get("reply_count") is None
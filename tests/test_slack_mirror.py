@@ -0,0 +1,102 @@
+import threading
+import time
+from contextlib import closing
+
+import pytest
+
+from comms.clients import slack_mirror
+
+
+def _ts(minutes_ago: float) -> str:
+    return f"{time.time() - minutes_ago * 60:.6f}"
+
+
+class SlackClient:
+    """Stub WebClient over one channel's history and threads.
+
+    ``history`` and ``threads`` (root ts -> replies) are edited in place to
+    change what Slack returns. While ``gate`` is clear, history calls wait.
+    """
+
+    def __init__(self, history, threads=None):
+        self.history = history
+        self.threads = threads or {}
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def conversations_history(self, channel, oldest, limit, cursor):
+        self.gate.wait(5)
+        messages = [m for m in self.history if m["ts"] > oldest]
+        return {"messages": sorted(messages, key=lambda m: m["ts"], reverse=True)}
+
+    def conversations_replies(self, channel, ts, limit, cursor):
+        root = next(m for m in self.history if m["ts"] == ts)
+        return {"messages": [root] + self.threads.get(ts, [])}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("COMMS_SLACK_MIRROR_CHANNELS", "C1")
+    stub = SlackClient([
+        {"ts": _ts(30), "user": "U1", "text": "pricing draft attached"},
+        {"ts": _ts(20), "user": "U2", "text": "wrong channel, sorry"},
+    ])
+    monkeypatch.setattr(slack_mirror, "_user_client", lambda: stub)
+    monkeypatch.setattr(slack_mirror, "_ensure_users", lambda client: None)
+    monkeypatch.setattr(slack_mirror, "_synced_at", 0.0)
+    monkeypatch.setattr(slack_mirror, "_syncing", False)
+    return stub
+
+
+def _texts(results):
+    return [
+        message["text"]
+        for channel in results["channels"]
+        for thread in channel["threads"]
+        for message in thread["matches"]
+    ]
+
+
+def _search(query):
+    with closing(slack_mirror._connect()) as conn:
+        return _texts(slack_mirror._search(conn, query, 20))
+
+
+def test_sync_applies_recent_edits_and_deletions(client):
+    root = client.history[0]
+    reply = {"ts": _ts(10), "thread_ts": root["ts"], "user": "U2"}
+    client.threads[root["ts"]] = [reply | {"text": "pricing looks fine"}]
+    root["reply_count"] = 1
+    slack_mirror.sync_mirror()
+    assert sorted(_search("pricing")) == [
+        "pricing draft attached", "pricing looks fine",
+    ]
+
+    root["text"] = "pricing final attached"
+    client.threads[root["ts"]].clear()
+    root["reply_count"] = 0
+    client.history.pop()
+    slack_mirror.sync_mirror()
+
+    assert _search("pricing") == ["pricing final attached"]
+    assert _search("draft") == []
+    assert _search("sorry") == []
+
+
+def test_search_answers_while_the_mirror_syncs(client):
+    slack_mirror.sync_mirror()
+    client.history.append({"ts": _ts(1), "user": "U1", "text": "pricing update"})
+    client.gate.clear()
+    slack_mirror._synced_at = 0.0
+
+    results = slack_mirror.search_mirror("pricing")
+
+    assert results["syncing"]
+    assert _texts(results) == ["pricing draft attached"]
+    client.gate.set()
+    deadline = time.monotonic() + 5
+    while slack_mirror._syncing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sorted(_texts(slack_mirror.search_mirror("pricing"))) == [
+        "pricing draft attached", "pricing update",
+    ]
@@ -0,0 +1,49 @@
+from comms.clients import transcripts
+
+HEADER_TRANSCRIPT = """\
+Alice (00:05)
+Hi everyone, agenda: pricing and hiring.
+Bob (01:10)
+Sounds good. Note: the deck is late.
+"""
+
+
+def test_header_format_keeps_colon_lines_in_the_turn():
+    turns = transcripts.parse(HEADER_TRANSCRIPT)
+
+    assert [(t["speaker"], t["start"]) for t in turns] == [("Alice", 5), ("Bob", 70)]
+    assert turns[0]["text"] == "Hi everyone, agenda: pricing and hiring."
+    assert turns[1]["text"] == "Sounds good. Note: the deck is late."
+
+
+def test_inline_formats_still_split_on_speaker_prefixes():
+    text = (
+        "00:00:05 Alice: Hi, see https://example.com\n"
+        "[01:10] Bob: Agreed.\n"
+        "Carol (02:00): Last point.\n"
+        "continued here\n"
+    )
+
+    turns = transcripts.parse(text)
+
+    assert [(t["speaker"], t["start"]) for t in turns] == [
+        ("Alice", 5), ("Bob", 70), ("Carol", 120),
+    ]
+    assert turns[0]["text"] == "Hi, see https://example.com"
+    assert turns[2]["text"] == "Last point. continued here"
+
+
+def test_slice_by_time_keeps_header_turns():
+    turns = transcripts.parse(HEADER_TRANSCRIPT)
+
+    result = transcripts.slice_turns(turns, start="01:00")
+
+    assert result["speakers"] == ["Alice", "Bob"]
+    assert [t["speaker"] for t in result["turns"]] == ["Bob"]
+
+
+def test_turns_follow_a_transcript_that_grew():
+    partial = HEADER_TRANSCRIPT.split("Bob")[0]
+
+    assert len(transcripts.get_turns("rec", partial)) == 1
+    assert len(transcripts.get_turns("rec", HEADER_TRANSCRIPT)) == 2